@@ -0,0 +1,15 @@
+"""YAML helpers that use libyaml's C loader when available."""
+
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+
+def fast_safe_load(stream: str | bytes | IO) -> Any:
+    """Drop-in for yaml.safe_load, backed by CSafeLoader when possible."""
+    return yaml.load(stream, Loader=_SafeLoader)
@@ -0,0 +1,41 @@
+"""Signed Merkle checkpoints over runs of audit entry hashes."""
+
+import hmac
+from hashlib import sha256
+
+CHECKPOINT_ACTION = "checkpoint"
+CHECKPOINT_INTERVAL = 1024
+
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+
+def merkle_root(entry_hashes: list[str]) -> str:
+    """Compute the Merkle root of a list of "sha256:<hex>" entry hashes.
+
+    Leaves and interior nodes are domain-separated (RFC 6962 style) and an
+    unpaired node at the end of a level is promoted unchanged.
+    """
+    if not entry_hashes:
+        raise ValueError("Cannot compute a Merkle root of zero entries")
+
+    level = [sha256(_LEAF_PREFIX + h.encode()).digest() for h in entry_hashes]
+    while len(level) > 1:
+        paired = [
+            sha256(_NODE_PREFIX + level[i] + level[i + 1]).digest()
+            for i in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return "sha256:" + level[0].hex()
+
+
+def sign_checkpoint(key: bytes, root: str) -> str:
+    """Sign a checkpoint root with the agent's checkpoint key."""
+    return "hmac-sha256:" + hmac.new(key, root.encode(), sha256).hexdigest()
+
+
+def verify_checkpoint(key: bytes, root: str, signature: str) -> bool:
+    """Check a checkpoint signature in constant time."""
+    return hmac.compare_digest(sign_checkpoint(key, root), signature)
@@ -1,24 +1,162 @@
 """Append-only JSONL audit logger with hash chain."""
 
-import hashlib
-import json
+import fcntl
+import os
+import struct
+import tempfile
 import uuid
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime
+from hashlib import sha256
 from pathlib import Path
+from typing import BinaryIO
 
+import orjson
+
+from vestbridge.audit.checkpoint import (
+    CHECKPOINT_ACTION,
+    CHECKPOINT_INTERVAL,
+    merkle_root,
+    sign_checkpoint,
+)
 from vestbridge.audit.models import AuditEntry
 
+TAIL_BLOCK_SIZE = 8192
+FSYNC_EVERY = 100
+INDEX_RECORD = struct.Struct("<Q")
+AGGREGATE_SIZE = 32
+CANONICAL_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+UNHASHED_FIELDS = frozenset({"entry_hash", "signature"})
+# Hashed AuditEntry fields, resolved once from the fixed schema
+HASHED_FIELDS = tuple(name for name in AuditEntry.model_fields if name not in UNHASHED_FIELDS)
+
+
+def hash_payload(payload: dict) -> str:
+    """Hash a JSON-mode entry payload that excludes entry_hash and signature.
+
+    The canonical form is the payload serialized with sorted keys and no
+    whitespace, hashed directly from the orjson bytes. hashlib's sha256 is
+    OpenSSL-backed and uses SHA-NI / ARMv8 CE where available.
+    """
+    return "sha256:" + sha256(orjson.dumps(payload, option=CANONICAL_OPTIONS)).hexdigest()
+
+
+def canonical_bytes(entry: AuditEntry) -> bytes:
+    """Serialize the hashed fields of an entry in canonical form.
+
+    Reads the fixed field set straight off the instance and lets orjson
+    handle datetimes and nested dicts, skipping model_dump. Values orjson
+    can't serialize natively fall back to pydantic's JSON-mode dump.
+    """
+    values = entry.__dict__
+    try:
+        return orjson.dumps(
+            {name: values[name] for name in HASHED_FIELDS},
+            option=CANONICAL_OPTIONS | orjson.OPT_UTC_Z,
+        )
+    except TypeError:
+        payload = entry.model_dump(mode="json", exclude=set(UNHASHED_FIELDS))
+        return orjson.dumps(payload, option=CANONICAL_OPTIONS)
+
+
+def compute_entry_hash(entry: AuditEntry) -> str:
+    """Hash everything except entry_hash and signature."""
+    return "sha256:" + sha256(canonical_bytes(entry)).hexdigest()
+
+
+def load_entry(line: bytes | str) -> AuditEntry:
+    """Build an AuditEntry from a line this logger wrote, skipping validation."""
+    data = orjson.loads(line)
+    data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+    return AuditEntry.model_construct(**data)
+
+
+def _is_checkpoint(line: bytes) -> bool:
+    """Whether a stored line is a checkpoint entry."""
+    # Cheap byte-level prefilter before parsing
+    return b'"checkpoint"' in line and orjson.loads(line)["action"] == CHECKPOINT_ACTION
+
+
+def _replace_file(path: Path, data: bytes) -> None:
+    """Atomically replace path with data via a uniquely named temp file beside it."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def fold_entry_hash(aggregate: int, entry_hash: str) -> int:
+    """XOR an entry's sha256 digest into an order-independent aggregate."""
+    return aggregate ^ int(entry_hash.partition(":")[2], 16)
+
 
 class AuditLogger:
     """Append-only JSONL logger with hash chain.
 
     Each entry's prev_hash points to the previous entry's hash,
     forming an integrity-verifiable chain.
+
+    With a checkpoint_key, a signed checkpoint entry holding the Merkle root
+    of the preceding entry hashes is appended every checkpoint_every entries,
+    letting verifiers holding the key authenticate each segment's hashes.
+    They add nothing against anyone who can also read the key.
+
+    The XOR of all entry digests is kept in memory and persisted, together
+    with the log offset it covers, to a sidecar next to the log whenever the
+    log is fsynced and on close(), so two copies of a log can be compared in
+    O(1) via the aggregate property. Readers only catch up in memory.
+
+    Entries are appended through one O_APPEND descriptor held open for the
+    logger's lifetime and fsynced every fsync_every entries (0 leaves syncing
+    to the OS). Call close(), or use the logger as a context manager, to sync
+    and release it.
+
+    Several loggers, in one process or many, may append to the same log:
+    each batch is encoded and written under an exclusive flock on the log,
+    and a logger that finds entries it didn't write re-reads the chain tail
+    before encoding, so the hash chain never forks.
+
+    The byte offset of every entry is kept in an .idx sidecar of packed
+    uint64s, so read_entries(last_n=N) seeks straight to the N-th entry from
+    the end instead of parsing the whole log.
     """
 
-    def __init__(self, log_path: Path) -> None:
+    def __init__(
+        self,
+        log_path: Path,
+        checkpoint_key: bytes | None = None,
+        checkpoint_every: int = CHECKPOINT_INTERVAL,
+        fsync_every: int = FSYNC_EVERY,
+    ) -> None:
+        if not 0 < checkpoint_every <= CHECKPOINT_INTERVAL:
+            raise ValueError(f"checkpoint_every must be between 1 and {CHECKPOINT_INTERVAL}")
+        if fsync_every < 0:
+            raise ValueError("fsync_every must be 0 or greater")
+
         self.log_path = log_path
-        self._last_hash = self._read_last_hash()
+        self.checkpoint_key = checkpoint_key
+        self.checkpoint_every = checkpoint_every
+        self.fsync_every = fsync_every
+        self._fd: int | None = None
+        self._unsynced = 0
+        self._stats_cache_path = log_path.with_suffix(".stats.json")
+        self._agg_path = log_path.with_suffix(".agg.bin")
+        self._idx_path = log_path.with_suffix(".idx")
+        self._idx_fd: int | None = None
+        # Chain state, (re)read under the lock whenever the log's end isn't
+        # where this logger last left it
+        self._end: int | None = None
+        self._last_hash: str | None = None
+        self._pending_hashes: list[str] = []
+        # (log offset, aggregate) loaded on first use; dirty once appended to
+        self._agg: tuple[int, int] | None = None
+        self._agg_dirty = False
 
     def log(
         self,
@@ -32,92 +170,487 @@ class AuditLogger:
         result: dict | None = None,
     ) -> AuditEntry:
         """Create and append an audit entry to the log."""
+        fields = {
+            "agent_id": agent_id,
+            "action": action,
+            "params": params,
+            "mandate_id": mandate_id,
+            "mandate_hash": mandate_hash,
+            "mandate_check": mandate_check,
+            "mandate_reason": mandate_reason,
+            "result": result,
+        }
+        return self.log_batch([fields])[0]
+
+    def log_batch(self, events: list[dict]) -> list[AuditEntry]:
+        """Append several entries, each a dict of log() keyword arguments.
+
+        The entries are chained and hashed in order and written with a single
+        os.write, so a burst of events costs one syscall instead of one each.
+        Any checkpoints that fall due are written in the same batch.
+        """
+        entries: list[AuditEntry] = []
+        buf = bytearray()
+        starts: list[int] = []  # offset of each line within buf
+
+        with self._locked():
+            covered, aggregate = self._load_aggregate()
+            for fields in events:
+                starts.append(len(buf))
+                entry = self._encode(buf, **fields)
+                aggregate = fold_entry_hash(aggregate, entry.entry_hash)
+                entries.append(entry)
+
+                if self.checkpoint_key is not None:
+                    self._pending_hashes.append(entry.entry_hash)
+                    if len(self._pending_hashes) >= self.checkpoint_every:
+                        starts.append(len(buf))
+                        checkpoint = self._encode(buf, **self._checkpoint_fields(entry.agent_id))
+                        aggregate = fold_entry_hash(aggregate, checkpoint.entry_hash)
+
+            if buf:
+                # An aggregate that stops short of the end (e.g. at a torn
+                # line) doesn't cover what follows; drop it rather than record it
+                self._write(bytes(buf), starts, aggregate if covered == self._end else None)
+        return entries
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold an exclusive lock on the log, with the chain state caught up to its end."""
+        fd = self._open()
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            end = os.lseek(fd, 0, os.SEEK_END)
+            if end != self._end:
+                self._resume()
+            # Nobody else appends until unlock, so the next write lands here
+            self._end = end
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+    def _resume(self) -> None:
+        """Re-read the chain tail after the log changed behind this logger."""
+        # Checked in full when first opened; after that its last record is
+        # enough to find where entries other writers appended begin
+        self._sync_index(None if self._idx_fd is None else 1)
+        if self._idx_fd is not None:
+            os.close(self._idx_fd)
+        # Reopened in case another writer swapped in a rebuilt index
+        self._idx_fd = os.open(self._idx_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        self._last_hash = self._read_last_hash()
+        if self.checkpoint_key is not None:
+            self._pending_hashes = self._read_pending_hashes()
+
+    def _encode(self, buf: bytearray, **fields) -> AuditEntry:
+        """Chain and hash a new entry from the given fields and append its line to buf."""
         entry = AuditEntry(
             event_id=f"evt_{uuid.uuid4().hex[:12]}",
             timestamp=datetime.now(UTC),
-            agent_id=agent_id,
-            action=action,
-            params=params,
-            mandate_id=mandate_id,
-            mandate_hash=mandate_hash,
-            mandate_check=mandate_check,
-            mandate_reason=mandate_reason,
-            result=result,
             prev_hash=self._last_hash,
+            **fields,
         )
-        entry.entry_hash = self._compute_hash(entry)
+        # Serialize the canonical payload once: hash those exact bytes, then
+        # splice the unhashed fields in before the closing brace
+        canonical = canonical_bytes(entry)
+        entry.entry_hash = "sha256:" + sha256(canonical).hexdigest()
         self._last_hash = entry.entry_hash
 
-        self.log_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.log_path, "a") as f:
-            f.write(entry.model_dump_json() + "\n")
-
+        buf += b'%s,"entry_hash":%s,"signature":%s}\n' % (
+            canonical[:-1],
+            orjson.dumps(entry.entry_hash),
+            orjson.dumps(entry.signature),
+        )
         return entry
 
-    def read_entries(self, last_n: int | None = None) -> list[AuditEntry]:
-        """Read entries from the audit log."""
+    def _checkpoint_fields(self, agent_id: str) -> dict:
+        """Fields of a signed checkpoint over the entries since the last one."""
+        root = merkle_root(self._pending_hashes)
+        fields = {
+            "agent_id": agent_id,
+            "action": CHECKPOINT_ACTION,
+            "params": {"merkle_root": root, "entries": len(self._pending_hashes)},
+            "signature": sign_checkpoint(self.checkpoint_key, root),
+        }
+        self._pending_hashes = []
+        return fields
+
+    def _open(self) -> int:
+        """The append descriptor for the log, opened on first use."""
+        if self._fd is None:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            self._end = None
+        return self._fd
+
+    def _write(self, data: bytes, starts: list[int], aggregate: int | None) -> None:
+        """Append encoded lines to the log, index them and apply the fsync policy.
+
+        Called under _locked(), so the lines start exactly at the end it saw.
+        """
+        base = self._end
+        os.write(self._fd, data)
+        end = self._end = base + len(data)
+        if aggregate is None:
+            self._agg, self._agg_dirty = None, False
+        else:
+            self._agg, self._agg_dirty = (end, aggregate), True
+
+        os.write(self._idx_fd, b"".join(INDEX_RECORD.pack(base + start) for start in starts))
+
+        self._unsynced += len(starts)
+        if self.fsync_every and self._unsynced >= self.fsync_every:
+            os.fsync(self._fd)
+            self._unsynced = 0
+            self._save_aggregate()
+
+    def close(self) -> None:
+        """Sync any unsynced entries and close the log file descriptor."""
+        if self._fd is None:
+            return
+        if self._unsynced:
+            os.fsync(self._fd)
+            self._unsynced = 0
+        self._save_aggregate()
+        os.close(self._fd)
+        self._fd = None
+        if self._idx_fd is not None:
+            os.close(self._idx_fd)
+            self._idx_fd = None
+
+    def __enter__(self) -> "AuditLogger":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        if getattr(self, "_fd", None) is not None:
+            self.close()
+
+    @property
+    def aggregate(self) -> bytes:
+        """XOR of the sha256 digests of every entry in the log."""
+        return self._load_aggregate()[1].to_bytes(AGGREGATE_SIZE, "big")
+
+    def _load_aggregate(self) -> tuple[int, int]:
+        """(offset, aggregate) caught up in memory on entries past the offset.
+
+        Starts from the sidecar on first use, then from the last value this
+        logger held, so entries other writers appended are folded in too.
+        """
+        if self._agg is not None:
+            offset, aggregate = self._agg
+        else:
+            offset, aggregate = self._read_aggregate()
+
+        size = self.log_path.stat().st_size if self.log_path.exists() else 0
+        if offset > size:
+            # Log was truncated or replaced — rebuild from scratch
+            offset, aggregate = 0, 0
+        if offset < size:
+            with open(self.log_path, "rb") as f:
+                f.seek(offset)
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        break
+                    offset += len(raw)
+                    line = raw.strip()
+                    if line:
+                        aggregate = fold_entry_hash(aggregate, orjson.loads(line)["entry_hash"])
+
+        self._agg = (offset, aggregate)
+        return self._agg
+
+    def _read_aggregate(self) -> tuple[int, int]:
+        """(offset, aggregate) from the sidecar, or (0, 0) if missing or torn."""
+        try:
+            data = self._agg_path.read_bytes()
+        except OSError:
+            return 0, 0
+        if len(data) != 8 + AGGREGATE_SIZE:
+            return 0, 0
+        return int.from_bytes(data[:8], "big"), int.from_bytes(data[8:], "big")
+
+    def _save_aggregate(self) -> None:
+        """Atomically persist the aggregate sidecar if this logger has appended."""
+        if not self._agg_dirty or self._agg is None:
+            return
+        offset, aggregate = self._agg
+        _replace_file(
+            self._agg_path, offset.to_bytes(8, "big") + aggregate.to_bytes(AGGREGATE_SIZE, "big")
+        )
+        self._agg_dirty = False
+
+    def read_entries(
+        self, last_n: int | None = None, include_checkpoints: bool = True
+    ) -> list[AuditEntry]:
+        """Read entries from the audit log.
+
+        With include_checkpoints=False, checkpoint entries are left out and
+        don't count towards last_n.
+        """
+        return [load_entry(line) for line in self._read_lines(last_n, include_checkpoints)]
+
+    def read_entries_raw(
+        self, last_n: int | None = None, include_checkpoints: bool = True
+    ) -> list[dict]:
+        """Read entries as their stored JSON objects, without building models."""
+        lines = self._read_lines(last_n, include_checkpoints)
+        return [orjson.loads(line) for line in lines]
+
+    def _read_lines(
+        self, last_n: int | None = None, include_checkpoints: bool = True
+    ) -> list[bytes]:
+        """Raw lines of the whole log or of its last N entries, optionally without checkpoints."""
+        lines = self._read_tail(last_n)
+        if include_checkpoints:
+            return lines
+        if last_n is None or last_n <= 0:
+            return [line for line in lines if not _is_checkpoint(line)]
+
+        # Read further back by the number of checkpoints skipped until N
+        # entries are found or the start of the log is reached
+        fetched = last_n
+        while True:
+            kept = [line for line in lines if not _is_checkpoint(line)]
+            if len(kept) >= last_n or len(lines) < fetched:
+                return kept[-last_n:]
+            fetched += last_n - len(kept)
+            lines = self._read_tail(fetched)
+
+    def _read_tail(self, last_n: int | None = None) -> list[bytes]:
+        """Raw lines of the whole log, or of its last N entries."""
         if not self.log_path.exists():
             return []
 
-        entries = []
-        with open(self.log_path) as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    entries.append(AuditEntry.model_validate_json(line))
+        offset = 0
+        if last_n is not None and last_n > 0:
+            offset = self._tail_offset(last_n)
+
+        with open(self.log_path, "rb") as f:
+            f.seek(offset)
+            lines = filter(None, (line.strip() for line in f))
+            if last_n is not None and last_n > 0:
+                # Keep only the last N raw lines; memory stays bounded even
+                # if the index could not narrow the read
+                return list(deque(lines, maxlen=last_n))
+            entries = list(lines)
 
         if last_n is not None:
             return entries[-last_n:]
         return entries
 
+    def _read_index(self, last_n: int | None = None) -> list[int] | None:
+        """All offsets in the index, or only its last N; None if missing or torn."""
+        try:
+            with open(self._idx_path, "rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                count, torn = divmod(size, INDEX_RECORD.size)
+                if torn:
+                    return None
+                first = 0 if last_n is None else max(count - last_n, 0)
+                f.seek(first * INDEX_RECORD.size)
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        return [offset for (offset,) in INDEX_RECORD.iter_unpack(data)]
+
+    @staticmethod
+    def _indexed_end(log: BinaryIO, offsets: list[int]) -> int | None:
+        """Log position just past the last indexed entry, or None if the offsets don't fit.
+
+        The offsets must strictly increase, lie within the log, start on line
+        boundaries and end at a complete entry; anything else means the index
+        is stale or was written out of order.
+        """
+        if not offsets:
+            return 0
+        if any(b <= a for a, b in zip(offsets, offsets[1:])):
+            return None
+        if offsets[-1] >= log.seek(0, os.SEEK_END):
+            return None
+        for offset in (offsets[0], offsets[-1]):
+            if offset:
+                log.seek(offset - 1)
+                if log.read(1) != b"\n":
+                    return None
+        log.seek(offsets[-1])
+        line = log.readline()
+        if not (line.endswith(b"\n") and line.strip()):
+            return None
+        return log.tell()
+
+    @staticmethod
+    def _scan_offsets(log: BinaryIO, start: int) -> Iterator[int]:
+        """Offsets of the complete, non-blank lines from start onwards."""
+        log.seek(start)
+        pos = start
+        for raw in log:
+            if not raw.endswith(b"\n"):
+                break  # partially written line
+            if raw.strip():
+                yield pos
+            pos += len(raw)
+
+    def _tail_offset(self, last_n: int) -> int:
+        """Offset of the first of the last N entries.
+
+        Readers never write the index: entries the index doesn't cover yet
+        are scanned in memory, and an index that doesn't fit the log is
+        ignored in favour of a full scan. Only the writer repairs it.
+        """
+        tail = self._read_index(last_n) or []
+        with open(self.log_path, "rb") as f:
+            start = self._indexed_end(f, tail)
+            if start is None:
+                tail, start = [], 0
+            offsets = deque(tail, maxlen=last_n)
+            offsets.extend(self._scan_offsets(f, start))
+        return offsets[0] if offsets else 0
+
+    def _sync_index(self, last_n: int | None = None) -> None:
+        """Bring the index up to date with the log before this writer appends to it.
+
+        Only the last N records are checked if given. Missing offsets are
+        appended; a torn index or one whose offsets don't strictly increase
+        or no longer fit the log is rebuilt and swapped in atomically.
+        """
+        offsets = self._read_index(last_n)
+        with open(self.log_path, "rb") as f:
+            start = None if offsets is None else self._indexed_end(f, offsets)
+            rebuild = start is None
+            missing = list(self._scan_offsets(f, 0 if rebuild else start))
+
+        if rebuild:
+            _replace_file(self._idx_path, b"".join(INDEX_RECORD.pack(offset) for offset in missing))
+        elif missing:
+            with open(self._idx_path, "ab") as f:
+                f.write(b"".join(INDEX_RECORD.pack(offset) for offset in missing))
+
     def get_daily_stats(self, agent_id: str) -> tuple[float, int]:
         """Get today's total notional traded and trade count for an agent.
 
         Returns (daily_notional, daily_trade_count).
+
+        Per-day totals are kept in a sidecar cache together with the byte offset
+        they cover, so each call only parses entries appended since the last one.
         """
-        today = datetime.now(UTC).date()
-        daily_notional = 0.0
-        daily_trade_count = 0
-
-        entries = self.read_entries()
-        for entry in entries:
-            if entry.agent_id != agent_id:
-                continue
-            if entry.timestamp.date() != today:
-                continue
-            if entry.action != "place_order":
-                continue
-            if entry.mandate_check != "PASS":
-                continue
-
-            # Extract notional from result
-            if entry.result and "filled_price" in entry.result and "qty" in entry.params:
-                daily_notional += entry.result["filled_price"] * entry.params["qty"]
-            daily_trade_count += 1
-
-        return daily_notional, daily_trade_count
+        today = datetime.now(UTC).date().isoformat()
+        cached = self._load_stats_cache()
+        offset, days = cached
+
+        if self.log_path.exists():
+            if offset > self.log_path.stat().st_size:
+                # Log was truncated or replaced — rebuild from scratch
+                offset, days = 0, {}
+
+            with open(self.log_path, "rb") as f:
+                f.seek(offset)
+                for raw in f:
+                    if not raw.endswith(b"\n"):
+                        # Partially written line; pick it up on the next call
+                        break
+                    offset += len(raw)
+                    # Cheap byte-level prefilter: only passed orders can count
+                    if b'"place_order"' not in raw or b'"PASS"' not in raw:
+                        continue
+                    self._accumulate_stats(days, orjson.loads(raw))
+
+        # Only today's bucket can ever be asked for again
+        days = {today: days.get(today, {})}
+        if (offset, days) != cached:
+            self._save_stats_cache(offset, days)
+
+        notional, count = days[today].get(agent_id, (0.0, 0))
+        return notional, count
 
     @staticmethod
-    def _compute_hash(entry: AuditEntry) -> str:
-        """Hash everything except entry_hash and signature."""
-        hashable = entry.model_dump(exclude={"entry_hash", "signature"})
-        canonical = json.dumps(hashable, sort_keys=True, default=str)
-        return "sha256:" + hashlib.sha256(canonical.encode()).hexdigest()
+    def _accumulate_stats(days: dict[str, dict[str, list]], entry: dict) -> None:
+        """Add a raw log entry to the per-day, per-agent trade totals."""
+        if entry.get("action") != "place_order":
+            return
+        if entry.get("mandate_check") != "PASS":
+            return
+
+        timestamp = entry["timestamp"]
+        if timestamp.endswith("Z"):
+            # Zulu timestamps (everything this logger writes) already start with the UTC date
+            day = timestamp[:10]
+        else:
+            day = datetime.fromisoformat(timestamp).astimezone(UTC).date().isoformat()
+        stats = days.setdefault(day, {}).setdefault(entry["agent_id"], [0.0, 0])
+
+        # Extract notional from result
+        result = entry.get("result") or {}
+        filled_price = result.get("filled_price")
+        qty = entry.get("params", {}).get("qty")
+        if filled_price is not None and qty is not None:
+            stats[0] += filled_price * qty
+        stats[1] += 1
+
+    def _load_stats_cache(self) -> tuple[int, dict[str, dict[str, list]]]:
+        """Load (offset, per-day stats) from the sidecar cache, or start empty."""
+        try:
+            data = orjson.loads(self._stats_cache_path.read_bytes())
+            return int(data["offset"]), data["days"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return 0, {}
+
+    def _save_stats_cache(self, offset: int, days: dict[str, dict[str, list]]) -> None:
+        """Atomically write the sidecar cache next to the log."""
+        self._stats_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        _replace_file(self._stats_cache_path, orjson.dumps({"offset": offset, "days": days}))
 
     def _read_last_hash(self) -> str | None:
-        """Read the last entry's hash from the log file, or None if empty."""
+        """Read the last entry's hash from the log file, or None if empty.
+
+        Reads backward from the end of the file in fixed-size blocks until a
+        complete last line is found, so startup cost does not grow with the log.
+        """
         if not self.log_path.exists():
             return None
 
-        last_line = None
-        with open(self.log_path) as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    last_line = line
-
+        last_line = next(self._iter_lines_reversed(), None)
         if last_line is None:
             return None
 
-        entry = AuditEntry.model_validate_json(last_line)
-        return entry.entry_hash
+        return orjson.loads(last_line)["entry_hash"]
+
+    def _read_pending_hashes(self) -> list[str]:
+        """Read hashes of the entries logged since the last checkpoint, oldest first."""
+        if not self.log_path.exists():
+            return []
+
+        # Older uncheckpointed entries (e.g. from before checkpointing was enabled)
+        # are left out so the next checkpoint never spans more than checkpoint_every
+        pending: list[str] = []
+        for line in self._iter_lines_reversed():
+            if len(pending) >= self.checkpoint_every - 1:
+                break
+            data = orjson.loads(line)
+            if data.get("action") == CHECKPOINT_ACTION:
+                break
+            pending.append(data["entry_hash"])
+        pending.reverse()
+        return pending
+
+    def _iter_lines_reversed(self) -> Iterator[bytes]:
+        """Yield the log's non-empty lines from last to first, reading backward from EOF."""
+        with open(self.log_path, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            remainder = b""
+            while pos > 0:
+                read_size = min(TAIL_BLOCK_SIZE, pos)
+                pos -= read_size
+                f.seek(pos)
+                lines = (f.read(read_size) + remainder).split(b"\n")
+                # The first piece may be cut mid-line; finish it with the next block back
+                remainder = lines[0]
+                for line in reversed(lines[1:]):
+                    line = line.strip()
+                    if line:
+                        yield line
+            line = remainder.strip()
+            if line:
+                yield line
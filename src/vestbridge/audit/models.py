@@ -1,13 +1,13 @@
 """Pydantic models for audit trail entries."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 
 from pydantic import BaseModel, Field
 
 
 class AuditEntry(BaseModel):
     event_id: str = Field(default_factory=lambda: "")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
     agent_id: str
     action: str
     params: dict
@@ -2,76 +2,338 @@
 
 import hashlib
 import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import NamedTuple
 
+import orjson
+from pydantic import ValidationError
+
+from vestbridge.audit.checkpoint import (
+    CHECKPOINT_ACTION,
+    CHECKPOINT_INTERVAL,
+    merkle_root,
+    verify_checkpoint,
+)
+from vestbridge.audit.logger import (
+    AGGREGATE_SIZE,
+    UNHASHED_FIELDS,
+    fold_entry_hash,
+    hash_payload,
+)
 from vestbridge.audit.models import AuditEntry, VerificationResult
 
+READ_BUFFER_SIZE = 1 << 20
+PARALLEL_MIN_BYTES = 64 << 20
+
+
+class _RangeError(NamedTuple):
+    kind: str  # "parse", "prev_hash" or "hash"
+    line: int  # 0-based line index within the range
+    entry: int  # 1-based entry number within the range
+    detail: str
+
+
+class _RangeResult(NamedTuple):
+    first_prev_hash: str | None
+    first_event_id: str | None
+    last_hash: str | None
+    entries: int
+    lines: int
+    error: _RangeError | None
+
+
+def _parse_line(line: bytes) -> dict:
+    """Parse a log line into a raw entry dict."""
+    data = orjson.loads(line)
+    if not isinstance(data, dict):
+        raise ValueError("entry is not a JSON object")
+    return data
+
+
+def _hash_mismatch(data: dict) -> str | None:
+    """Return the recomputed hash if it doesn't match the entry's, else None.
+
+    The canonical payload is rebuilt straight from the parsed line; pydantic is
+    only involved for the fallback to the pre-orjson canonical form.
+    """
+    computed_hash = hash_payload({k: v for k, v in data.items() if k not in UNHASHED_FIELDS})
+    if data.get("entry_hash") == computed_hash:
+        return None
+    try:
+        legacy_hash = AuditVerifier._compute_legacy_hash(AuditEntry.model_validate(data))
+    except ValidationError:
+        return computed_hash
+    if data.get("entry_hash") == legacy_hash:
+        return None
+    return computed_hash
+
+
+def _verify_range(log_path: Path, start: int, end: int) -> _RangeResult:
+    """Verify the entries whose lines start within [start, end) of the log.
+
+    Each entry's own hash only depends on its stored fields, so a range can be
+    checked independently; only the first entry's prev_hash is left for the
+    caller to stitch against the previous range.
+    """
+    first_prev_hash: str | None = None
+    first_event_id: str | None = None
+    prev_hash: str | None = None
+    entries = 0
+    lines = 0
+
+    def result(error: _RangeError | None = None) -> _RangeResult:
+        return _RangeResult(first_prev_hash, first_event_id, prev_hash, entries, lines, error)
+
+    with open(log_path, "rb", buffering=READ_BUFFER_SIZE) as f:
+        f.seek(start)
+        pos = start
+        for raw in f:
+            if pos >= end:
+                break
+            pos += len(raw)
+            lines += 1
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                data = _parse_line(line)
+            except ValueError as e:
+                return result(_RangeError("parse", lines - 1, entries + 1, str(e)))
+            entries += 1
+            event_id = data.get("event_id")
+
+            if entries == 1:
+                first_prev_hash = data.get("prev_hash")
+                first_event_id = event_id
+            elif data.get("prev_hash") != prev_hash:
+                return result(
+                    _RangeError(
+                        "prev_hash",
+                        lines - 1,
+                        entries,
+                        f"({event_id}): prev_hash mismatch. "
+                        f"Expected {prev_hash}, got {data.get('prev_hash')}",
+                    )
+                )
+
+            # Verify entry's own hash
+            if computed_hash := _hash_mismatch(data):
+                return result(
+                    _RangeError(
+                        "hash",
+                        lines - 1,
+                        entries,
+                        f"({event_id}): hash mismatch. "
+                        f"Expected {computed_hash}, got {data.get('entry_hash')}",
+                    )
+                )
+
+            prev_hash = data.get("entry_hash")
+
+    return result()
+
+
+def _split_ranges(log_path: Path, size: int, parts: int) -> list[tuple[int, int]]:
+    """Split the file into roughly equal byte ranges that start on line boundaries."""
+    bounds = [0]
+    with open(log_path, "rb") as f:
+        for k in range(1, parts):
+            target = max(bounds[-1], size * k // parts)
+            if target > 0:
+                f.seek(target - 1)
+                f.readline()  # advance to the start of the next line
+            bounds.append(min(f.tell(), size))
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
 
 class AuditVerifier:
     """Verify the integrity of an audit log's hash chain."""
 
-    def verify(self, log_path: Path) -> VerificationResult:
-        """Read the entire audit log and verify hash chain integrity.
+    def verify(
+        self,
+        log_path: Path,
+        workers: int | None = 1,
+        checkpoint_key: bytes | None = None,
+    ) -> VerificationResult:
+        """Stream the audit log and verify hash chain integrity.
 
         Checks:
         1. Each entry's hash matches its contents
         2. Each entry's prev_hash matches the previous entry's hash
         3. First entry's prev_hash is None
+
+        Entries are checked one at a time as they are read, so memory use is
+        constant and the first failure is reported without reading the rest.
+
+        With workers > 1 (None means one per CPU), logs of at least
+        PARALLEL_MIN_BYTES are split into line-aligned byte ranges verified in
+        separate processes, then stitched by checking that each range's first
+        prev_hash equals the previous range's last entry_hash.
+
+        With a checkpoint_key, every entry is verified as above and each
+        checkpoint's signature and Merkle root are additionally checked against
+        the recomputed hashes of the entries it covers.
         """
         if not log_path.exists():
             return VerificationResult(valid=True, entries_checked=0)
 
-        entries: list[AuditEntry] = []
-        with open(log_path) as f:
-            for i, line in enumerate(f):
-                line = line.strip()
+        if checkpoint_key is not None:
+            return self._verify_with_checkpoints(log_path, checkpoint_key)
+
+        size = log_path.stat().st_size
+        workers = workers or os.cpu_count() or 1
+        if workers > 1 and size >= PARALLEL_MIN_BYTES:
+            ranges = _split_ranges(log_path, size, workers)
+            with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+                results = list(pool.map(_verify_range, [log_path] * len(ranges), *zip(*ranges)))
+        else:
+            results = [_verify_range(log_path, 0, size)]
+
+        return self._stitch(results)
+
+    def aggregate(self, log_path: Path) -> bytes:
+        """XOR of the sha256 digests of every entry in the log.
+
+        The result is independent of entry order, so two replicas hold the same
+        set of entries exactly when their aggregates match.
+        """
+        aggregate = 0
+        if log_path.exists():
+            with open(log_path, "rb", buffering=READ_BUFFER_SIZE) as f:
+                for raw in f:
+                    line = raw.strip()
+                    if line:
+                        aggregate = fold_entry_hash(aggregate, orjson.loads(line)["entry_hash"])
+        return aggregate.to_bytes(AGGREGATE_SIZE, "big")
+
+    def _verify_with_checkpoints(self, log_path: Path, key: bytes) -> VerificationResult:
+        """Verify the chain and every entry's hash, then authenticate each checkpoint.
+
+        A checkpoint signs a Merkle root over entry hashes, not over entry
+        content, so every entry is rehashed before its hash is admitted into
+        a root; the checkpoint only proves those recomputed hashes are the
+        ones the key holder logged.
+        """
+        prev_hash: str | None = None
+        count = 0
+        # Verified hashes of entries since the last checkpoint, oldest first;
+        # no checkpoint spans more than CHECKPOINT_INTERVAL entries
+        pending: deque[str] = deque(maxlen=CHECKPOINT_INTERVAL)
+
+        with open(log_path, "rb", buffering=READ_BUFFER_SIZE) as f:
+            for i, raw in enumerate(f):
+                line = raw.strip()
                 if not line:
                     continue
                 try:
-                    entries.append(AuditEntry.model_validate_json(line))
-                except Exception as e:
+                    data = _parse_line(line)
+                except ValueError as e:
                     return VerificationResult(
                         valid=False,
                         entries_checked=i,
                         first_error=f"Line {i + 1}: failed to parse entry: {e}",
                     )
+                count += 1
+                event_id = data.get("event_id")
 
-        if not entries:
-            return VerificationResult(valid=True, entries_checked=0)
+                if data.get("prev_hash") != prev_hash:
+                    return VerificationResult(
+                        valid=False,
+                        entries_checked=count,
+                        first_error=(
+                            f"Entry {count} ({event_id}): prev_hash mismatch. "
+                            f"Expected {prev_hash}, got {data.get('prev_hash')}"
+                        ),
+                    )
+                if computed_hash := _hash_mismatch(data):
+                    return VerificationResult(
+                        valid=False,
+                        entries_checked=count,
+                        first_error=(
+                            f"Entry {count} ({event_id}): hash mismatch. "
+                            f"Expected {computed_hash}, got {data.get('entry_hash')}"
+                        ),
+                    )
+                prev_hash = data.get("entry_hash")
+
+                if data.get("action") != CHECKPOINT_ACTION:
+                    pending.append(prev_hash)
+                    continue
+
+                params = data.get("params") or {}
+                root = params.get("merkle_root")
+                covered = params.get("entries")
+                signature = data.get("signature")
+                valid = (
+                    isinstance(root, str)
+                    and isinstance(covered, int)
+                    and 0 < covered <= len(pending)
+                    and isinstance(signature, str)
+                    and verify_checkpoint(key, root, signature)
+                    and merkle_root(list(pending)[-covered:]) == root
+                )
+                if not valid:
+                    return VerificationResult(
+                        valid=False,
+                        entries_checked=count,
+                        first_error=f"Entry {count} ({event_id}): invalid checkpoint",
+                    )
+                pending.clear()
 
+        return VerificationResult(valid=True, entries_checked=count)
+
+    @staticmethod
+    def _stitch(results: list[_RangeResult]) -> VerificationResult:
+        """Combine per-range results in file order into one verification result."""
         prev_hash: str | None = None
+        entries = 0
+        lines = 0
 
-        for i, entry in enumerate(entries):
-            # Verify prev_hash chain
-            if entry.prev_hash != prev_hash:
-                return VerificationResult(
-                    valid=False,
-                    entries_checked=i + 1,
-                    first_error=(
-                        f"Entry {i + 1} ({entry.event_id}): prev_hash mismatch. "
-                        f"Expected {prev_hash}, got {entry.prev_hash}"
-                    ),
+        for r in results:
+            error = r.error
+            # The first entry of a range is checked against the previous range
+            if r.entries and r.first_prev_hash != prev_hash:
+                error = _RangeError(
+                    "prev_hash",
+                    0,
+                    1,
+                    f"({r.first_event_id}): prev_hash mismatch. "
+                    f"Expected {prev_hash}, got {r.first_prev_hash}",
                 )
 
-            # Verify entry's own hash
-            computed_hash = self._compute_hash(entry)
-            if entry.entry_hash != computed_hash:
+            if error is not None:
+                if error.kind == "parse":
+                    line = lines + error.line
+                    return VerificationResult(
+                        valid=False,
+                        entries_checked=line,
+                        first_error=f"Line {line + 1}: failed to parse entry: {error.detail}",
+                    )
+                entry = entries + error.entry
                 return VerificationResult(
                     valid=False,
-                    entries_checked=i + 1,
-                    first_error=(
-                        f"Entry {i + 1} ({entry.event_id}): hash mismatch. "
-                        f"Expected {computed_hash}, got {entry.entry_hash}"
-                    ),
+                    entries_checked=entry,
+                    first_error=f"Entry {entry} {error.detail}",
                 )
 
-            prev_hash = entry.entry_hash
+            if r.entries:
+                prev_hash = r.last_hash
+            entries += r.entries
+            lines += r.lines
 
-        return VerificationResult(valid=True, entries_checked=len(entries))
+        return VerificationResult(valid=True, entries_checked=entries)
 
     @staticmethod
-    def _compute_hash(entry: AuditEntry) -> str:
-        """Recompute an entry's hash for verification."""
+    def _compute_legacy_hash(entry: AuditEntry) -> str:
+        """Recompute a hash in the pre-orjson canonical form.
+
+        Entries written before the switch to orjson were hashed from stdlib
+        json.dumps output; those logs must keep verifying.
+        """
         hashable = entry.model_dump(exclude={"entry_hash", "signature"})
         canonical = json.dumps(hashable, sort_keys=True, default=str)
         return "sha256:" + hashlib.sha256(canonical.encode()).hexdigest()
@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import StrEnum
+from functools import cached_property
 
 from pydantic import BaseModel
 
@@ -52,6 +53,10 @@ class Position(BaseModel):
     unrealized_pnl: float
     asset_type: AssetType = AssetType.EQUITY
 
+    @cached_property
+    def symbol_upper(self) -> str:
+        return self.symbol.upper()
+
 
 class Account(BaseModel):
     account_id: str
@@ -1,11 +1,17 @@
 """Paper trading broker adapter for testing and demos."""
 
-import json
+import os
 import random
 import uuid
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import UTC, datetime
 from pathlib import Path
 
+import orjson
+
+from vestbridge import config
 from vestbridge.brokers.base import (
     Account,
     BrokerAdapter,
@@ -18,10 +24,14 @@ from vestbridge.brokers.base import (
     Quote,
     Side,
 )
-from vestbridge.config import PAPER_DIR
 
 DEFAULT_CASH = 100_000.0
-STATE_FILE = PAPER_DIR / "state.json"
+STATE_FILE_NAME = "state.json"
+
+# (broker, symbol -> price) for the innermost active price_snapshot() block
+_price_snapshot: ContextVar[tuple["PaperBroker", dict[str, float]] | None] = ContextVar(
+    "paper_price_snapshot", default=None
+)
 
 
 class PaperState:
@@ -59,42 +69,79 @@ class PaperBroker(BrokerAdapter):
     - Supports market and limit orders
     - Persists state to ~/.vest/paper/state.json between runs
     - Default starting cash: $100,000
+    - Pass a seed for reproducible simulated prices
     """
 
-    def __init__(self, state_path: Path | None = None) -> None:
-        self.state_path = state_path or STATE_FILE
+    def __init__(self, state_path: Path | None = None, seed: int | None = None) -> None:
+        self.state_path = state_path or config.get_paths().paper / STATE_FILE_NAME
         self.state = self._load_state()
+        self._rng = random.Random(seed)
+        self._dirty = False  # set when cash, positions or orders change
 
     def _load_state(self) -> PaperState:
         if self.state_path.exists():
-            with open(self.state_path) as f:
-                return PaperState.from_dict(json.load(f))
+            return PaperState.from_dict(orjson.loads(self.state_path.read_bytes()))
         return PaperState()
 
     def _save_state(self) -> None:
+        """Atomically write the state file if anything changed since the last save."""
+        if not self._dirty:
+            return
         self.state_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.state_path, "w") as f:
-            json.dump(self.state.to_dict(), f, indent=2)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        tmp_path.write_bytes(orjson.dumps(self.state.to_dict(), option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, self.state_path)
+        self._dirty = False
+
+    @contextmanager
+    def price_snapshot(self) -> Iterator[None]:
+        """Advance each symbol's simulated price at most once within the block.
+
+        Lets one tool call see a single coherent set of prices, e.g. so an
+        order fills at the price its mandate checks were evaluated against.
+        The snapshot is scoped to the current context, so concurrent calls
+        each get their own.
+        """
+        token = _price_snapshot.set((self, {}))
+        try:
+            yield
+        finally:
+            _price_snapshot.reset(token)
 
     def _get_simulated_price(self, symbol: str) -> float:
         """Get or generate a simulated price for a symbol."""
-        if symbol not in self.state.prices:
-            # Generate a reasonable starting price
-            self.state.prices[symbol] = round(random.uniform(20.0, 500.0), 2)
-        else:
-            # Small random walk from last price
-            last = self.state.prices[symbol]
-            change = last * random.uniform(-0.02, 0.02)
-            self.state.prices[symbol] = round(max(0.01, last + change), 2)
-        return self.state.prices[symbol]
+        return self._simulated_prices([symbol])[0]
+
+    def _simulated_prices(self, symbols: Iterable[str]) -> list[float]:
+        """Advance and return simulated prices for several symbols in one pass."""
+        rand = self._rng.random
+        prices = self.state.prices
+        active = _price_snapshot.get()
+        snapshot = active[1] if active is not None and active[0] is self else None
+        result = []
+        for symbol in symbols:
+            if snapshot is not None and symbol in snapshot:
+                result.append(snapshot[symbol])
+                continue
+            last = prices.get(symbol)
+            if last is None:
+                # Generate a reasonable starting price
+                price = round(20.0 + 480.0 * rand(), 2)
+            else:
+                # Small random walk (+/-2%) from last price
+                price = round(max(0.01, last + last * (0.04 * rand() - 0.02)), 2)
+            prices[symbol] = price
+            if snapshot is not None:
+                snapshot[symbol] = price
+            result.append(price)
+        return result
+
+    def _positions_value(self) -> float:
+        held = {s: pos["qty"] for s, pos in self.state.positions.items() if pos["qty"] > 0}
+        return sum(qty * price for qty, price in zip(held.values(), self._simulated_prices(held)))
 
     def _portfolio_value(self) -> float:
-        positions_value = sum(
-            pos["qty"] * self._get_simulated_price(symbol)
-            for symbol, pos in self.state.positions.items()
-            if pos["qty"] > 0
-        )
-        return self.state.cash + positions_value
+        return self.state.cash + self._positions_value()
 
     async def get_quote(self, symbol: str) -> Quote:
         price = self._get_simulated_price(symbol)
@@ -104,16 +151,14 @@ class PaperBroker(BrokerAdapter):
             price=price,
             bid=round(price - spread, 2),
             ask=round(price + spread, 2),
-            volume=random.randint(100_000, 10_000_000),
+            volume=self._rng.randint(100_000, 10_000_000),
             timestamp=datetime.now(UTC),
         )
 
     async def get_positions(self) -> list[Position]:
+        held = {symbol: pos for symbol, pos in self.state.positions.items() if pos["qty"] > 0}
         positions = []
-        for symbol, pos in self.state.positions.items():
-            if pos["qty"] <= 0:
-                continue
-            current_price = self._get_simulated_price(symbol)
+        for (symbol, pos), current_price in zip(held.items(), self._simulated_prices(held)):
             market_value = pos["qty"] * current_price
             cost_basis = pos["qty"] * pos["avg_cost"]
             positions.append(
@@ -129,11 +174,7 @@ class PaperBroker(BrokerAdapter):
         return positions
 
     async def get_account(self) -> Account:
-        positions_value = sum(
-            pos["qty"] * self._get_simulated_price(symbol)
-            for symbol, pos in self.state.positions.items()
-            if pos["qty"] > 0
-        )
+        positions_value = self._positions_value()
         portfolio_value = self.state.cash + positions_value
         return Account(
             account_id="paper",
@@ -172,6 +213,7 @@ class PaperBroker(BrokerAdapter):
                     "limit_price": order.limit_price,
                     "timestamp": now.isoformat(),
                 }
+                self._dirty = True
                 self._save_state()
                 return OrderResult(
                     order_id=order_id,
@@ -191,6 +233,7 @@ class PaperBroker(BrokerAdapter):
                     "limit_price": order.limit_price,
                     "timestamp": now.isoformat(),
                 }
+                self._dirty = True
                 self._save_state()
                 return OrderResult(
                     order_id=order_id,
@@ -226,6 +269,7 @@ class PaperBroker(BrokerAdapter):
                     timestamp=now,
                 )
             self.state.cash -= total_cost
+            self._dirty = True
             if symbol in self.state.positions:
                 existing = self.state.positions[symbol]
                 new_qty = existing["qty"] + order.qty
@@ -249,6 +293,7 @@ class PaperBroker(BrokerAdapter):
                     timestamp=now,
                 )
             self.state.cash += total_cost
+            self._dirty = True
             self.state.positions[symbol]["qty"] -= order.qty
             if self.state.positions[symbol]["qty"] == 0:
                 del self.state.positions[symbol]
@@ -270,6 +315,7 @@ class PaperBroker(BrokerAdapter):
     async def cancel_order(self, order_id: str) -> CancelResult:
         if order_id in self.state.pending_orders:
             del self.state.pending_orders[order_id]
+            self._dirty = True
             self._save_state()
             return CancelResult(
                 order_id=order_id,
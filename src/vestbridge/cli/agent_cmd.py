@@ -3,7 +3,6 @@
 import click
 
 from vestbridge.cli.main import cli
-from vestbridge.config import ensure_dirs
 
 
 @cli.group()
@@ -14,6 +13,7 @@ def agent() -> None:
 @agent.command("list")
 def list_cmd() -> None:
     """List all registered agents."""
+    from vestbridge.config import ensure_dirs
     from vestbridge.identity.agent import list_agents
 
     ensure_dirs()
@@ -23,14 +23,20 @@ def list_cmd() -> None:
         click.echo("No agents registered. Create one with: vest agent create")
         return
 
-    for a in agents:
-        click.echo(f"  {a.agent_id}  {a.name:<20}  created: {a.created_at.isoformat()[:10]}")
+    click.echo(
+        "".join(
+            f"  {a.agent_id}  {a.name:<20}  created: {a.created_at.isoformat()[:10]}\n"
+            for a in agents
+        ),
+        nl=False,
+    )
 
 
 @agent.command()
 @click.option("--name", default="default", help="Agent name")
 def create(name: str) -> None:
     """Create a new agent."""
+    from vestbridge.config import ensure_dirs
     from vestbridge.identity.agent import create_agent
 
     ensure_dirs()
@@ -1,8 +1,10 @@
 """vest audit — audit trail commands."""
 
-import json
+from collections.abc import Iterable
+from typing import BinaryIO, TextIO
 
 import click
+import orjson
 
 from vestbridge.cli.main import cli
 
@@ -14,10 +16,26 @@ def audit() -> None:
 
 @audit.command()
 @click.option("--agent", default=None, help="Agent ID (default: first agent)")
-def verify(agent: str | None) -> None:
+@click.option(
+    "--workers",
+    default=1,
+    type=int,
+    help="Worker processes for large logs (0 = one per CPU)",
+)
+@click.option(
+    "--checkpoints",
+    "checkpoints",
+    is_flag=True,
+    help="Also check signed checkpoints against the agent's key",
+)
+def verify(agent: str | None, workers: int, checkpoints: bool) -> None:
     """Verify audit log hash chain integrity."""
     from vestbridge.audit.verifier import AuditVerifier
-    from vestbridge.identity.agent import get_agent_audit_path, get_or_create_default_agent
+    from vestbridge.identity.agent import (
+        get_agent_audit_path,
+        get_agent_checkpoint_key,
+        get_or_create_default_agent,
+    )
 
     agent_id = agent or get_or_create_default_agent().agent_id
     audit_path = get_agent_audit_path(agent_id)
@@ -26,8 +44,15 @@ def verify(agent: str | None) -> None:
         click.echo(f"No audit log found for agent {agent_id}")
         return
 
+    checkpoint_key = None
+    if checkpoints:
+        checkpoint_key = get_agent_checkpoint_key(agent_id, create=False)
+        if checkpoint_key is None:
+            click.echo(f"No checkpoint key found for agent {agent_id}")
+            raise SystemExit(1)
+
     verifier = AuditVerifier()
-    result = verifier.verify(audit_path)
+    result = verifier.verify(audit_path, workers=workers or None, checkpoint_key=checkpoint_key)
 
     if result.valid:
         click.echo(f"Audit log verified: {result.entries_checked} entries, chain intact.")
@@ -41,7 +66,7 @@ def verify(agent: str | None) -> None:
 @click.option("--agent", default=None, help="Agent ID (default: first agent)")
 @click.option("--last", "n", default=20, type=int, help="Number of entries to show")
 def show(agent: str | None, n: int) -> None:
-    """Print recent audit entries."""
+    """Print recent audit entries, leaving out checkpoints."""
     from vestbridge.audit.logger import AuditLogger
     from vestbridge.identity.agent import get_agent_audit_path, get_or_create_default_agent
 
@@ -53,15 +78,18 @@ def show(agent: str | None, n: int) -> None:
         return
 
     logger = AuditLogger(audit_path)
-    entries = logger.read_entries(last_n=n)
+    entries = logger.read_entries(last_n=n, include_checkpoints=False)
 
+    # Build the listing first and write it with a single echo
+    lines = []
     for entry in entries:
         check_str = ""
         if entry.mandate_check:
             check_str = f" [{entry.mandate_check}]"
-        click.echo(f"  {entry.timestamp.isoformat()[:19]}  {entry.action:<15}{check_str}")
+        lines.append(f"  {entry.timestamp.isoformat()[:19]}  {entry.action:<15}{check_str}\n")
         if entry.mandate_reason:
-            click.echo(f"    reason: {entry.mandate_reason}")
+            lines.append(f"    reason: {entry.mandate_reason}\n")
+    click.echo("".join(lines), nl=False)
 
 
 @audit.command()
@@ -70,10 +98,6 @@ def show(agent: str | None, n: int) -> None:
 @click.option("--output", "output_path", default=None, help="Output file path")
 def export(agent: str | None, fmt: str, output_path: str | None) -> None:
     """Export audit log to JSON or CSV."""
-    import csv
-    import io
-
-    from vestbridge.audit.logger import AuditLogger
     from vestbridge.identity.agent import get_agent_audit_path, get_or_create_default_agent
 
     agent_id = agent or get_or_create_default_agent().agent_id
@@ -83,29 +107,53 @@ def export(agent: str | None, fmt: str, output_path: str | None) -> None:
         click.echo(f"No audit log found for agent {agent_id}")
         return
 
-    logger = AuditLogger(audit_path)
-    entries = logger.read_entries()
-
-    if fmt == "json":
-        data = [e.model_dump(mode="json") for e in entries]
-        content = json.dumps(data, indent=2, default=str)
-    else:
-        output = io.StringIO()
-        if entries:
-            fields = list(entries[0].model_dump().keys())
-            writer = csv.DictWriter(output, fieldnames=fields)
-            writer.writeheader()
-            for entry in entries:
-                row = entry.model_dump(mode="json")
-                row["params"] = json.dumps(row["params"])
-                if row["result"]:
-                    row["result"] = json.dumps(row["result"])
-                writer.writerow(row)
-        content = output.getvalue()
+    # Entries are streamed straight from the log, one line at a time
+    with open(audit_path, "rb") as log:
+        lines = filter(None, (line.strip() for line in log))
+        if fmt == "json":
+            if output_path:
+                with open(output_path, "wb") as out:
+                    count = _export_json(lines, out)
+            else:
+                count = _export_json(lines, click.get_binary_stream("stdout"))
+        else:
+            if output_path:
+                with open(output_path, "w", newline="") as out:
+                    count = _export_csv(lines, out)
+            else:
+                count = _export_csv(lines, click.get_text_stream("stdout"))
 
     if output_path:
-        with open(output_path, "w") as f:
-            f.write(content)
-        click.echo(f"Exported {len(entries)} entries to {output_path}")
-    else:
-        click.echo(content)
+        click.echo(f"Exported {count} entries to {output_path}")
+
+
+def _export_json(lines: Iterable[bytes], out: BinaryIO) -> int:
+    """Write log lines as a JSON array, reusing each line's JSON unchanged."""
+    count = 0
+    out.write(b"[")
+    for line in lines:
+        out.write(b",\n  " if count else b"\n  ")
+        out.write(line)
+        count += 1
+    out.write(b"\n]\n" if count else b"]\n")
+    return count
+
+
+def _export_csv(lines: Iterable[bytes], out: TextIO) -> int:
+    """Write log lines as CSV rows, with params and result as JSON strings."""
+    import csv
+
+    from vestbridge.audit.models import AuditEntry
+
+    writer = csv.DictWriter(out, fieldnames=list(AuditEntry.model_fields), extrasaction="ignore")
+    count = 0
+    for line in lines:
+        row = orjson.loads(line)
+        row["params"] = orjson.dumps(row.get("params")).decode()
+        if row.get("result"):
+            row["result"] = orjson.dumps(row["result"]).decode()
+        if not count:
+            writer.writeheader()
+        writer.writerow(row)
+        count += 1
+    return count
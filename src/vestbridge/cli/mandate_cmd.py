@@ -6,6 +6,15 @@ import click
 
 from vestbridge.cli.main import cli
 
+# (permission attribute, label, formatter) for the fields `mandate check` reports
+_MANDATE_FIELDS = (
+    ("allowed_symbols", "allowed symbols", ", ".join),
+    ("blocked_symbols", "blocked symbols", ", ".join),
+    ("max_order_size_usd", "max order size", "${:,.0f}".format),
+    ("max_daily_notional_usd", "max daily notional", "${:,.0f}".format),
+    ("max_concentration_pct", "max concentration", "{}%".format),
+)
+
 
 @cli.group()
 def mandate() -> None:
@@ -27,16 +36,10 @@ def check(mandate_path: str) -> None:
         m = load_mandate(path)
         click.echo(f"Mandate is valid: {m.mandate_id}")
         p = m.permissions
-        if p.allowed_symbols:
-            click.echo(f"  allowed symbols: {', '.join(p.allowed_symbols)}")
-        if p.blocked_symbols:
-            click.echo(f"  blocked symbols: {', '.join(p.blocked_symbols)}")
-        if p.max_order_size_usd:
-            click.echo(f"  max order size: ${p.max_order_size_usd:,.0f}")
-        if p.max_daily_notional_usd:
-            click.echo(f"  max daily notional: ${p.max_daily_notional_usd:,.0f}")
-        if p.max_concentration_pct:
-            click.echo(f"  max concentration: {p.max_concentration_pct}%")
+        for attr, label, fmt in _MANDATE_FIELDS:
+            value = getattr(p, attr)
+            if value:
+                click.echo(f"  {label}: {fmt(value)}")
     except Exception as e:
         click.echo(f"Invalid mandate: {e}")
         raise SystemExit(1)
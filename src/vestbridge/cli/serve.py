@@ -11,8 +11,12 @@ from vestbridge.cli.main import cli
 @click.option("--port", default=8080, type=int, help="Port for SSE transport")
 def serve(broker: str, transport: str, port: int) -> None:
     """Start the VestBridge MCP server."""
-    from vestbridge.config import ensure_dirs
+    from vestbridge.config import ensure_dirs, get_max_concurrency
 
+    try:
+        get_max_concurrency()
+    except ValueError as e:
+        raise click.UsageError(str(e)) from None
     ensure_dirs()
 
     if broker != "paper":
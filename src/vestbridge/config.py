@@ -1,13 +1,61 @@
 """Global config loading from ~/.vest/."""
 
+import os
+from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 
 from pydantic import BaseModel
 
-VEST_DIR = Path.home() / ".vest"
-MANDATES_DIR = VEST_DIR / "mandates"
-AGENTS_DIR = VEST_DIR / "agents"
-PAPER_DIR = VEST_DIR / "paper"
+
+@dataclass(frozen=True, slots=True)
+class VestPaths:
+    """Locations of the ~/.vest/ directory tree."""
+
+    vest: Path
+    mandates: Path
+    agents: Path
+    paper: Path
+
+    @classmethod
+    def under(cls, vest: Path) -> "VestPaths":
+        """The standard layout rooted at ``vest``."""
+        return cls(
+            vest=vest, mandates=vest / "mandates", agents=vest / "agents", paper=vest / "paper"
+        )
+
+
+@cache
+def get_paths() -> VestPaths:
+    """The ~/.vest/ tree, or the one under $VESTBRIDGE_HOME when that is set.
+
+    Resolved once per process; call get_paths.cache_clear() after changing
+    VESTBRIDGE_HOME.
+    """
+    home = os.environ.get("VESTBRIDGE_HOME")
+    return VestPaths.under(Path(home) if home else Path.home() / ".vest")
+
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+@cache
+def get_max_concurrency() -> int:
+    """Upper bound on MCP tool calls in flight, from $VESTBRIDGE_MAX_CONCURRENCY.
+
+    Resolved once per process. Raises ValueError when the variable is set to
+    anything but a whole number of at least 1.
+    """
+    raw = os.environ.get("VESTBRIDGE_MAX_CONCURRENCY")
+    if raw is None or not raw.strip():
+        return DEFAULT_MAX_CONCURRENCY
+    try:
+        limit = int(raw)
+    except ValueError:
+        limit = 0
+    if limit < 1:
+        raise ValueError(f"VESTBRIDGE_MAX_CONCURRENCY must be a whole number >= 1, got {raw!r}")
+    return limit
 
 
 class VestConfig(BaseModel):
@@ -15,22 +63,32 @@ class VestConfig(BaseModel):
     default_agent: str | None = None
 
 
+# Paths most recently created by ensure_dirs()
+_ensured_paths: VestPaths | None = None
+
+
 def ensure_dirs() -> None:
-    """Create the ~/.vest/ directory structure if it doesn't exist."""
-    VEST_DIR.mkdir(exist_ok=True)
-    MANDATES_DIR.mkdir(exist_ok=True)
-    AGENTS_DIR.mkdir(exist_ok=True)
-    PAPER_DIR.mkdir(exist_ok=True)
+    """Create the ~/.vest/ directory structure if it doesn't exist.
+
+    Only the first call per process touches the filesystem; later calls are
+    free unless the paths have been repointed since.
+    """
+    global _ensured_paths
+    paths = get_paths()
+    if paths == _ensured_paths:
+        return
+    for d in (paths.vest, paths.mandates, paths.agents, paths.paper):
+        d.mkdir(parents=True, exist_ok=True)
+    _ensured_paths = paths
 
 
 def load_config() -> VestConfig:
     """Load config from ~/.vest/config.yaml, or return defaults."""
     ensure_dirs()
-    config_path = VEST_DIR / "config.yaml"
+    config_path = get_paths().vest / "config.yaml"
     if config_path.exists():
-        import yaml
+        from vestbridge._yaml import fast_safe_load
 
-        with open(config_path) as f:
-            data = yaml.safe_load(f) or {}
+        data = fast_safe_load(config_path.read_bytes()) or {}
         return VestConfig(**data)
     return VestConfig()
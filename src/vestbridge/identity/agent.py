@@ -1,13 +1,16 @@
 """Agent identity — ID generation, metadata storage, and directory management."""
 
+import os
+import secrets
 import uuid
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 
-import yaml
 from pydantic import BaseModel, Field
 
-from vestbridge.config import AGENTS_DIR
+from vestbridge import config
+from vestbridge._yaml import fast_safe_load
 
 
 class AgentMetadata(BaseModel):
@@ -19,7 +22,7 @@ class AgentMetadata(BaseModel):
 
 def create_agent(name: str = "default", agents_dir: Path | None = None) -> AgentMetadata:
     """Create a new agent with a unique ID and directory structure."""
-    agents_dir = agents_dir or AGENTS_DIR
+    agents_dir = agents_dir or config.get_paths().agents
     agent_id = f"agt_{uuid.uuid4().hex[:8]}"
 
     agent_dir = agents_dir / agent_id
@@ -27,56 +30,103 @@ def create_agent(name: str = "default", agents_dir: Path | None = None) -> Agent
     (agent_dir / "keys").mkdir(exist_ok=True)
 
     metadata = AgentMetadata(agent_id=agent_id, name=name)
-
-    with open(agent_dir / "metadata.yaml", "w") as f:
-        yaml.dump(metadata.model_dump(mode="json"), f, default_flow_style=False)
+    (agent_dir / "metadata.json").write_text(metadata.model_dump_json(indent=2))
 
     return metadata
 
 
 def load_agent(agent_id: str, agents_dir: Path | None = None) -> AgentMetadata:
     """Load agent metadata from its directory."""
-    agents_dir = agents_dir or AGENTS_DIR
-    metadata_path = agents_dir / agent_id / "metadata.yaml"
-
-    if not metadata_path.exists():
+    agents_dir = agents_dir or config.get_paths().agents
+    metadata = _read_metadata(agents_dir / agent_id)
+    if metadata is None:
         raise FileNotFoundError(f"Agent not found: {agent_id}")
-
-    with open(metadata_path) as f:
-        data = yaml.safe_load(f)
-
-    return AgentMetadata(**data)
+    return metadata
 
 
 def list_agents(agents_dir: Path | None = None) -> list[AgentMetadata]:
     """List all registered agents."""
-    agents_dir = agents_dir or AGENTS_DIR
-    agents = []
-
-    if not agents_dir.exists():
-        return agents
-
-    for agent_dir in sorted(agents_dir.iterdir()):
-        if not agent_dir.is_dir():
-            continue
-        metadata_path = agent_dir / "metadata.yaml"
-        if metadata_path.exists():
-            with open(metadata_path) as f:
-                data = yaml.safe_load(f)
-            agents.append(AgentMetadata(**data))
-
-    return agents
+    return list(_iter_agents(agents_dir or config.get_paths().agents))
 
 
 def get_or_create_default_agent(agents_dir: Path | None = None) -> AgentMetadata:
     """Get the default agent, creating one if none exist."""
-    agents = list_agents(agents_dir)
-    if agents:
-        return agents[0]
+    agent = next(_iter_agents(agents_dir or config.get_paths().agents), None)
+    if agent is not None:
+        return agent
     return create_agent("default", agents_dir)
 
 
+def _iter_agents(agents_dir: Path) -> Iterator[AgentMetadata]:
+    """Yield registered agents in directory-name order, loading each lazily.
+
+    Uses os.scandir so directory checks come from the directory listing
+    instead of a stat per entry.
+    """
+    try:
+        with os.scandir(agents_dir) as it:
+            agent_dirs = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+    except FileNotFoundError:
+        return
+
+    for entry in agent_dirs:
+        metadata = _read_metadata(Path(entry.path))
+        if metadata is not None:
+            yield metadata
+
+
+def _read_metadata(agent_dir: Path) -> AgentMetadata | None:
+    """Read an agent's metadata.json, falling back to the older metadata.yaml."""
+    try:
+        return AgentMetadata.model_validate_json((agent_dir / "metadata.json").read_bytes())
+    except FileNotFoundError:
+        pass
+    try:
+        raw = (agent_dir / "metadata.yaml").read_bytes()
+    except FileNotFoundError:
+        return None
+    return AgentMetadata(**fast_safe_load(raw))
+
+
 def get_agent_audit_path(agent_id: str, agents_dir: Path | None = None) -> Path:
     """Get the audit log path for an agent."""
-    agents_dir = agents_dir or AGENTS_DIR
+    agents_dir = agents_dir or config.get_paths().agents
     return agents_dir / agent_id / "audit.jsonl"
+
+
+def get_agent_checkpoint_key(
+    agent_id: str, agents_dir: Path | None = None, create: bool = True
+) -> bytes | None:
+    """Get the key used to sign an agent's audit checkpoints.
+
+    The key is generated on first use and stored in the agent's keys
+    directory. With create=False, returns None if no key exists yet.
+
+    The key lives under the same vest directory as the log it signs, so
+    checkpoints only catch tampering by someone who can rewrite the log but
+    not read this file; anyone with access to the whole tree can re-sign it.
+    """
+    agents_dir = agents_dir or config.get_paths().agents
+    key_path = agents_dir / agent_id / "keys" / "audit_checkpoint.key"
+
+    try:
+        return key_path.read_bytes()
+    except FileNotFoundError:
+        if not create:
+            return None
+
+    # Write the key under a private name and link it into place, so a
+    # concurrent reader never sees a created-but-empty key file
+    key_path.parent.mkdir(parents=True, exist_ok=True)
+    key = secrets.token_bytes(32)
+    tmp_path = key_path.with_name(f".{key_path.name}.{uuid.uuid4().hex}")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(key)
+        os.link(tmp_path, key_path)
+    except FileExistsError:
+        return key_path.read_bytes()
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return key
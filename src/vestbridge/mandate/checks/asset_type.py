@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from vestbridge.mandate.models import CheckResult, MandatePermissions
+from vestbridge.mandate.models import CheckResult, MandatePermissions, passed_check
 
 if TYPE_CHECKING:
     from vestbridge.brokers.base import OrderRequest
@@ -19,11 +19,11 @@ class AssetTypeCheck:
     def evaluate(
         self, order: OrderRequest, permissions: MandatePermissions, context: TradingContext
     ) -> CheckResult:
-        if permissions.allowed_asset_types is None:
-            return CheckResult(check_name=self.name, passed=True)
+        allowed = permissions.allowed_asset_types_set
+        if allowed is None:
+            return passed_check(self.name)
 
-        allowed = [t.lower() for t in permissions.allowed_asset_types]
-        if order.asset_type.value.lower() not in allowed:
+        if order.asset_type not in allowed:
             return CheckResult(
                 check_name=self.name,
                 passed=False,
@@ -32,4 +32,4 @@ class AssetTypeCheck:
                     f"Allowed: {', '.join(permissions.allowed_asset_types)}"
                 ),
             )
-        return CheckResult(check_name=self.name, passed=True)
+        return passed_check(self.name)
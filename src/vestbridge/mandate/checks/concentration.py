@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from vestbridge.mandate.models import CheckResult, MandatePermissions
+from vestbridge.mandate.models import CheckResult, MandatePermissions, passed_check
 
 if TYPE_CHECKING:
     from vestbridge.brokers.base import OrderRequest
@@ -20,7 +20,7 @@ class ConcentrationCheck:
         self, order: OrderRequest, permissions: MandatePermissions, context: TradingContext
     ) -> CheckResult:
         if permissions.max_concentration_pct is None:
-            return CheckResult(check_name=self.name, passed=True)
+            return passed_check(self.name)
 
         if context.portfolio_value <= 0:
             return CheckResult(
@@ -31,12 +31,8 @@ class ConcentrationCheck:
 
         price = context.current_price or 0.0
 
-        # Find existing position in this symbol
-        existing_value = 0.0
-        for pos in context.positions:
-            if pos.symbol.upper() == order.symbol.upper():
-                existing_value = pos.market_value
-                break
+        pos = context.positions_by_symbol.get(order.symbol.upper())
+        existing_value = pos.market_value if pos else 0.0
 
         order_value = price * order.qty
         total_value = existing_value + order_value
@@ -51,4 +47,4 @@ class ConcentrationCheck:
                     f"exceeds max concentration {permissions.max_concentration_pct}%"
                 ),
             )
-        return CheckResult(check_name=self.name, passed=True)
+        return passed_check(self.name)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from vestbridge.mandate.models import CheckResult, MandatePermissions
+from vestbridge.mandate.models import CheckResult, MandatePermissions, passed_check
 
 if TYPE_CHECKING:
     from vestbridge.brokers.base import OrderRequest
@@ -20,7 +20,7 @@ class DailyVolumeCheck:
         self, order: OrderRequest, permissions: MandatePermissions, context: TradingContext
     ) -> CheckResult:
         if permissions.max_daily_notional_usd is None:
-            return CheckResult(check_name=self.name, passed=True)
+            return passed_check(self.name)
 
         price = context.current_price or 0.0
         order_value = price * order.qty
@@ -36,7 +36,7 @@ class DailyVolumeCheck:
                     f"(already traded ${context.daily_notional:,.2f} today)"
                 ),
             )
-        return CheckResult(check_name=self.name, passed=True)
+        return passed_check(self.name)
 
 
 class DailyTradeCountCheck:
@@ -48,7 +48,7 @@ class DailyTradeCountCheck:
         self, order: OrderRequest, permissions: MandatePermissions, context: TradingContext
     ) -> CheckResult:
         if permissions.max_daily_trades is None:
-            return CheckResult(check_name=self.name, passed=True)
+            return passed_check(self.name)
 
         if context.daily_trade_count >= permissions.max_daily_trades:
             return CheckResult(
@@ -59,4 +59,4 @@ class DailyTradeCountCheck:
                     f"max is {permissions.max_daily_trades}"
                 ),
             )
-        return CheckResult(check_name=self.name, passed=True)
+        return passed_check(self.name)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from vestbridge.mandate.models import CheckResult, MandatePermissions
+from vestbridge.mandate.models import CheckResult, MandatePermissions, passed_check
 
 if TYPE_CHECKING:
     from vestbridge.brokers.base import OrderRequest
@@ -20,7 +20,7 @@ class OrderSizeCheck:
         self, order: OrderRequest, permissions: MandatePermissions, context: TradingContext
     ) -> CheckResult:
         if permissions.max_order_size_usd is None:
-            return CheckResult(check_name=self.name, passed=True)
+            return passed_check(self.name)
 
         price = context.current_price or 0.0
         order_value = price * order.qty
@@ -34,7 +34,7 @@ class OrderSizeCheck:
                     f"${permissions.max_order_size_usd:,.2f}"
                 ),
             )
-        return CheckResult(check_name=self.name, passed=True)
+        return passed_check(self.name)
 
 
 class PortfolioPercentCheck:
@@ -46,7 +46,7 @@ class PortfolioPercentCheck:
         self, order: OrderRequest, permissions: MandatePermissions, context: TradingContext
     ) -> CheckResult:
         if permissions.max_portfolio_pct_per_order is None:
-            return CheckResult(check_name=self.name, passed=True)
+            return passed_check(self.name)
 
         if context.portfolio_value <= 0:
             return CheckResult(
@@ -68,4 +68,4 @@ class PortfolioPercentCheck:
                     f"exceeds max {permissions.max_portfolio_pct_per_order}%"
                 ),
             )
-        return CheckResult(check_name=self.name, passed=True)
+        return passed_check(self.name)
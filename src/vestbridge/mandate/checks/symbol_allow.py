@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from vestbridge.mandate.models import CheckResult, MandatePermissions
+from vestbridge.mandate.models import CheckResult, MandatePermissions, passed_check
 
 if TYPE_CHECKING:
     from vestbridge.brokers.base import OrderRequest
@@ -19,17 +19,17 @@ class SymbolAllowlistCheck:
     def evaluate(
         self, order: OrderRequest, permissions: MandatePermissions, context: TradingContext
     ) -> CheckResult:
-        if permissions.allowed_symbols is None:
-            return CheckResult(check_name=self.name, passed=True)
+        allowed = permissions.allowed_symbols_set
+        if allowed is None:
+            return passed_check(self.name)
 
-        allowed = [s.upper() for s in permissions.allowed_symbols]
         if order.symbol.upper() not in allowed:
             return CheckResult(
                 check_name=self.name,
                 passed=False,
                 reason=f"{order.symbol} is not in allowed symbols list",
             )
-        return CheckResult(check_name=self.name, passed=True)
+        return passed_check(self.name)
 
 
 class SymbolBlocklistCheck:
@@ -40,14 +40,14 @@ class SymbolBlocklistCheck:
     def evaluate(
         self, order: OrderRequest, permissions: MandatePermissions, context: TradingContext
     ) -> CheckResult:
-        if permissions.blocked_symbols is None:
-            return CheckResult(check_name=self.name, passed=True)
+        blocked = permissions.blocked_symbols_set
+        if blocked is None:
+            return passed_check(self.name)
 
-        blocked = [s.upper() for s in permissions.blocked_symbols]
         if order.symbol.upper() in blocked:
             return CheckResult(
                 check_name=self.name,
                 passed=False,
                 reason=f"{order.symbol} is in blocked symbols list",
             )
-        return CheckResult(check_name=self.name, passed=True)
+        return passed_check(self.name)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
-from vestbridge.mandate.models import CheckResult, MandatePermissions
+from vestbridge.mandate.models import CheckResult, MandatePermissions, passed_check
 
 if TYPE_CHECKING:
     from vestbridge.brokers.base import OrderRequest
@@ -16,6 +16,8 @@ MARKET_OPEN_HOUR = 9
 MARKET_OPEN_MINUTE = 30
 MARKET_CLOSE_HOUR = 16
 MARKET_CLOSE_MINUTE = 0
+_MARKET_OPEN_MIN = MARKET_OPEN_HOUR * 60 + MARKET_OPEN_MINUTE
+_MARKET_CLOSE_MIN = MARKET_CLOSE_HOUR * 60 + MARKET_CLOSE_MINUTE
 
 
 class TradingHoursCheck:
@@ -27,9 +29,10 @@ class TradingHoursCheck:
         self, order: OrderRequest, permissions: MandatePermissions, context: TradingContext
     ) -> CheckResult:
         if not permissions.trading_hours_only:
-            return CheckResult(check_name=self.name, passed=True)
+            return passed_check(self.name)
 
-        et_time = context.current_time.astimezone(ET)
+        now = context.current_time
+        et_time = now if now.tzinfo is ET else now.astimezone(ET)
 
         # Check weekday (0=Mon, 6=Sun)
         if et_time.weekday() >= 5:
@@ -40,10 +43,7 @@ class TradingHoursCheck:
             )
 
         current_minutes = et_time.hour * 60 + et_time.minute
-        market_open = MARKET_OPEN_HOUR * 60 + MARKET_OPEN_MINUTE
-        market_close = MARKET_CLOSE_HOUR * 60 + MARKET_CLOSE_MINUTE
-
-        if current_minutes < market_open or current_minutes >= market_close:
+        if current_minutes < _MARKET_OPEN_MIN or current_minutes >= _MARKET_CLOSE_MIN:
             return CheckResult(
                 check_name=self.name,
                 passed=False,
@@ -52,7 +52,7 @@ class TradingHoursCheck:
                     f"Market hours: 09:30-16:00 ET"
                 ),
             )
-        return CheckResult(check_name=self.name, passed=True)
+        return passed_check(self.name)
 
 
 class OrderTypeCheck:
@@ -63,11 +63,11 @@ class OrderTypeCheck:
     def evaluate(
         self, order: OrderRequest, permissions: MandatePermissions, context: TradingContext
     ) -> CheckResult:
-        if permissions.allowed_order_types is None:
-            return CheckResult(check_name=self.name, passed=True)
+        allowed = permissions.allowed_order_types_set
+        if allowed is None:
+            return passed_check(self.name)
 
-        allowed = [t.lower() for t in permissions.allowed_order_types]
-        if order.order_type.value.lower() not in allowed:
+        if order.order_type not in allowed:
             return CheckResult(
                 check_name=self.name,
                 passed=False,
@@ -76,7 +76,7 @@ class OrderTypeCheck:
                     f"Allowed: {', '.join(permissions.allowed_order_types)}"
                 ),
             )
-        return CheckResult(check_name=self.name, passed=True)
+        return passed_check(self.name)
 
 
 class SideCheck:
@@ -87,11 +87,11 @@ class SideCheck:
     def evaluate(
         self, order: OrderRequest, permissions: MandatePermissions, context: TradingContext
     ) -> CheckResult:
-        if permissions.allowed_sides is None:
-            return CheckResult(check_name=self.name, passed=True)
+        allowed = permissions.allowed_sides_set
+        if allowed is None:
+            return passed_check(self.name)
 
-        allowed = [s.lower() for s in permissions.allowed_sides]
-        if order.side.value.lower() not in allowed:
+        if order.side not in allowed:
             return CheckResult(
                 check_name=self.name,
                 passed=False,
@@ -100,4 +100,4 @@ class SideCheck:
                     f"Allowed: {', '.join(permissions.allowed_sides)}"
                 ),
             )
-        return CheckResult(check_name=self.name, passed=True)
+        return passed_check(self.name)
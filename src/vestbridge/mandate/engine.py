@@ -1,6 +1,9 @@
 """Mandate engine — pre-trade validation against mandate rules."""
 
+from collections import OrderedDict
+from collections.abc import Mapping
 from datetime import UTC, datetime
+from functools import cached_property
 
 from vestbridge.brokers.base import OrderRequest, Position
 from vestbridge.mandate.checks.asset_type import AssetTypeCheck
@@ -28,9 +31,29 @@ class TradingContext:
         self.portfolio_value = portfolio_value
         self.daily_notional = daily_notional
         self.daily_trade_count = daily_trade_count
-        self.current_time = current_time or datetime.now(UTC)
+        self._current_time = current_time
         self.current_price = current_price
 
+    @property
+    def current_time(self) -> datetime:
+        # Resolved on first use: only the trading-hours check reads the clock.
+        if self._current_time is None:
+            self._current_time = datetime.now(UTC)
+        return self._current_time
+
+    @current_time.setter
+    def current_time(self, value: datetime | None) -> None:
+        # None goes back to reading the clock on next access
+        self._current_time = value
+
+    @cached_property
+    def positions_by_symbol(self) -> dict[str, Position]:
+        """Positions keyed by uppercased symbol; the first position wins on duplicates."""
+        by_symbol: dict[str, Position] = {}
+        for pos in self.positions:
+            by_symbol.setdefault(pos.symbol_upper, pos)
+        return by_symbol
+
 
 class MandateCheck:
     """Base class for individual mandate checks."""
@@ -43,39 +66,134 @@ class MandateCheck:
         raise NotImplementedError
 
 
+RESULT_CACHE_SIZE = 1024
+
+
 class MandateEngine:
-    """Run all applicable mandate checks against a proposed order."""
+    """Run the mandate checks enabled by its permissions against a proposed order."""
 
     def __init__(self, mandate: Mandate) -> None:
         self.mandate = mandate
         self.checks = self._load_checks()
+        self._cache: OrderedDict[tuple, MandateResult] = OrderedDict()
 
     def _load_checks(self) -> list[MandateCheck]:
-        return [
-            OrderSizeCheck(),
-            ConcentrationCheck(),
-            SymbolAllowlistCheck(),
-            SymbolBlocklistCheck(),
-            AssetTypeCheck(),
-            DailyVolumeCheck(),
-            DailyTradeCountCheck(),
-            TradingHoursCheck(),
-            OrderTypeCheck(),
-            SideCheck(),
-            PortfolioPercentCheck(),
+        # Checks whose permission is unset always pass, so they are left out
+        # of the plan instead of being evaluated on every order. Cheap,
+        # selective checks run first so fast_fail rejections stop early.
+        p = self.mandate.permissions
+        plan = [
+            (p.blocked_symbols is not None, SymbolBlocklistCheck),
+            (p.trading_hours_only, TradingHoursCheck),
+            (p.max_daily_trades is not None, DailyTradeCountCheck),
+            (p.allowed_symbols is not None, SymbolAllowlistCheck),
+            (p.allowed_sides is not None, SideCheck),
+            (p.allowed_order_types is not None, OrderTypeCheck),
+            (p.allowed_asset_types is not None, AssetTypeCheck),
+            (p.max_order_size_usd is not None, OrderSizeCheck),
+            (p.max_portfolio_pct_per_order is not None, PortfolioPercentCheck),
+            (p.max_daily_notional_usd is not None, DailyVolumeCheck),
+            (p.max_concentration_pct is not None, ConcentrationCheck),
         ]
+        return [check() for enabled, check in plan if enabled]
+
+    def _cache_key(self, order: OrderRequest, context: TradingContext) -> tuple:
+        """Everything the built-in checks read, at the resolution they read it.
+
+        The permissions are not part of the key: Mandate and MandatePermissions
+        are frozen, so they are fixed for the engine's lifetime, like the plan.
+        """
+        p = self.mandate.permissions
+        existing = None
+        if p.max_concentration_pct is not None:
+            pos = context.positions_by_symbol.get(order.symbol.upper())
+            existing = pos.market_value if pos else 0.0
+        minute = None
+        if p.trading_hours_only:
+            minute = context.current_time.replace(second=0, microsecond=0)
+        return (
+            order.symbol,
+            order.qty,
+            order.side,
+            order.order_type,
+            order.asset_type,
+            context.current_price,
+            context.portfolio_value,
+            context.daily_notional,
+            context.daily_trade_count,
+            existing,
+            minute,
+        )
 
-    def evaluate(self, order: OrderRequest, context: TradingContext) -> MandateResult:
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def evaluate(
+        self, order: OrderRequest, context: TradingContext, fast_fail: bool = False
+    ) -> MandateResult:
+        """Evaluate an order; with ``fast_fail``, stop at the first failing check."""
+        # Previews, confirmations and retries re-evaluate the same order, and
+        # the checks are pure functions of the inputs captured by the key.
+        key = (fast_fail, *self._cache_key(order, context))
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        result = self._evaluate(order, context, fast_fail)
+        self._cache[key] = result
+        if len(self._cache) > RESULT_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return result
+
+    def evaluate_many(
+        self, orders: list[OrderRequest], context: TradingContext, prices: Mapping[str, float]
+    ) -> list[MandateResult]:
+        """Evaluate a basket of orders in sequence against one starting context.
+
+        Each order is priced from ``prices`` by symbol. Orders that pass count
+        towards the daily notional and trade totals seen by the orders after
+        them, as if the basket were submitted one order at a time.
+        """
+        daily_notional = context.daily_notional
+        daily_trade_count = context.daily_trade_count
+        results: list[MandateResult] = []
+        for order in orders:
+            price = prices.get(order.symbol)
+            order_context = TradingContext(
+                positions=context.positions,
+                portfolio_value=context.portfolio_value,
+                daily_notional=daily_notional,
+                daily_trade_count=daily_trade_count,
+                current_time=context.current_time,
+                current_price=price,
+            )
+            result = self.evaluate(order, order_context)
+            if result.passed:
+                daily_notional += (price or 0.0) * order.qty
+                daily_trade_count += 1
+            results.append(result)
+        return results
+
+    def _evaluate(
+        self, order: OrderRequest, context: TradingContext, fast_fail: bool
+    ) -> MandateResult:
+        permissions = self.mandate.permissions
         results: list[CheckResult] = []
+        passed = True
         for check in self.checks:
-            result = check.evaluate(order, self.mandate.permissions, context)
+            result = check.evaluate(order, permissions, context)
             results.append(result)
-
-        passed = all(r.passed for r in results)
-        blocked_reasons = [r.reason for r in results if not r.passed and r.reason]
-
-        return MandateResult(
-            passed=passed,
-            checks=results,
-            blocked_reason="; ".join(blocked_reasons) if blocked_reasons else None,
+            if not result.passed:
+                passed = False
+                if fast_fail:
+                    break
+        blocked_reason = None
+        if not passed:
+            blocked_reason = "; ".join(r.reason for r in results if not r.passed and r.reason)
+
+        # Every field is already the right type, so skip re-validating the
+        # check results on the way out.
+        return MandateResult.model_construct(
+            passed=passed, checks=results, blocked_reason=blocked_reason or None
         )
@@ -4,15 +4,13 @@ import uuid
 from datetime import UTC, datetime
 from pathlib import Path
 
-import yaml
-
+from vestbridge._yaml import fast_safe_load
 from vestbridge.mandate.models import Mandate
 
 
 def load_mandate(path: Path) -> Mandate:
     """Load a mandate from a YAML file."""
-    with open(path) as f:
-        data = yaml.safe_load(f)
+    data = fast_safe_load(path.read_bytes())
 
     if not data:
         raise ValueError(f"Empty mandate file: {path}")
@@ -26,11 +24,16 @@ def load_mandate(path: Path) -> Mandate:
     return Mandate(**data)
 
 
-def load_mandate_from_dir(mandates_dir: Path, name: str = "default") -> Mandate:
-    """Load a named mandate from the mandates directory."""
+def find_mandate_path(mandates_dir: Path, name: str = "default") -> Path:
+    """Resolve a named mandate to its .yaml (or .yml) file."""
     path = mandates_dir / f"{name}.yaml"
     if not path.exists():
         path = mandates_dir / f"{name}.yml"
     if not path.exists():
         raise FileNotFoundError(f"Mandate not found: {path}")
-    return load_mandate(path)
+    return path
+
+
+def load_mandate_from_dir(mandates_dir: Path, name: str = "default") -> Mandate:
+    """Load a named mandate from the mandates directory."""
+    return load_mandate(find_mandate_path(mandates_dir, name))
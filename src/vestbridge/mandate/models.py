@@ -1,11 +1,21 @@
 """Pydantic models for mandate specification and evaluation results."""
 
 from datetime import UTC, datetime
+from functools import cache, cached_property
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+def _normalized(values: list[str] | None, upper: bool) -> frozenset[str] | None:
+    if values is None:
+        return None
+    return frozenset(v.upper() if upper else v.lower() for v in values)
 
 
 class MandatePermissions(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     max_order_size_usd: float | None = None
     max_daily_notional_usd: float | None = None
     max_daily_trades: int | None = None
@@ -19,8 +29,50 @@ class MandatePermissions(BaseModel):
     trading_hours_only: bool = False
     require_limit_orders: bool = False
 
+    # Case-normalized lookup sets, derived on first use so checks do one hash
+    # lookup per order instead of re-normalizing the lists. The model is
+    # frozen so they cannot go stale; model_copy() drops them from the copy.
+    # Side, order type and asset type are lowercase StrEnums, so their
+    # members can be looked up in the lowercased sets directly.
+
+    @cached_property
+    def allowed_symbols_set(self) -> frozenset[str] | None:
+        return _normalized(self.allowed_symbols, upper=True)
+
+    @cached_property
+    def blocked_symbols_set(self) -> frozenset[str] | None:
+        return _normalized(self.blocked_symbols, upper=True)
+
+    @cached_property
+    def allowed_sides_set(self) -> frozenset[str] | None:
+        return _normalized(self.allowed_sides, upper=False)
+
+    @cached_property
+    def allowed_order_types_set(self) -> frozenset[str] | None:
+        return _normalized(self.allowed_order_types, upper=False)
+
+    @cached_property
+    def allowed_asset_types_set(self) -> frozenset[str] | None:
+        return _normalized(self.allowed_asset_types, upper=False)
+
+    def model_copy(
+        self, *, update: dict[str, Any] | None = None, deep: bool = False
+    ) -> "MandatePermissions":
+        copied = super().model_copy(update=update, deep=deep)
+        for name in _LOOKUP_SETS:
+            copied.__dict__.pop(name, None)
+        return copied
+
+
+_LOOKUP_SETS = tuple(
+    name for name, attr in vars(MandatePermissions).items() if isinstance(attr, cached_property)
+)
+
 
 class Mandate(BaseModel):
+    # Frozen like its permissions: MandateEngine plans and caches against them
+    model_config = ConfigDict(frozen=True)
+
     mandate_id: str = Field(default_factory=lambda: "")
     version: int = 1
     agent_id: str | None = None
@@ -30,11 +82,19 @@ class Mandate(BaseModel):
 
 
 class CheckResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     check_name: str
     passed: bool
     reason: str | None = None
 
 
+@cache
+def passed_check(check_name: str) -> CheckResult:
+    """Shared passing result for a check, so the common path allocates nothing."""
+    return CheckResult(check_name=check_name, passed=True)
+
+
 class MandateResult(BaseModel):
     passed: bool
     checks: list[CheckResult]
@@ -1,48 +1,158 @@
 """MCP server setup and tool registration."""
 
+import asyncio
+import functools
 import hashlib
-from datetime import UTC, datetime
+import os
+import threading
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import ParamSpec, TypeVar
 
 from mcp.server.fastmcp import FastMCP
 
+from vestbridge import config
 from vestbridge.audit.logger import AuditLogger
 from vestbridge.brokers.base import AssetType, OrderRequest, OrderType, Side
 from vestbridge.brokers.paper import PaperBroker
-from vestbridge.config import MANDATES_DIR, ensure_dirs
-from vestbridge.identity.agent import get_agent_audit_path, get_or_create_default_agent
+from vestbridge.identity.agent import (
+    get_agent_audit_path,
+    get_agent_checkpoint_key,
+    get_or_create_default_agent,
+)
 from vestbridge.mandate.engine import MandateEngine, TradingContext
-from vestbridge.mandate.loader import load_mandate_from_dir
+from vestbridge.mandate.loader import find_mandate_path, load_mandate
 
 mcp = FastMCP("vestbridge")
 
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# place_order reads the daily totals and then appends to the audit log; other
+# orders must not interleave between the two or they could share a limit
+_ORDER_LOCK = asyncio.Lock()
+
+
+_BROKERS: dict[str, PaperBroker] = {}
+
 
 def _get_broker(broker: str | None = None) -> PaperBroker:
-    """Get a broker adapter by name. Only paper is implemented."""
+    """Get a broker adapter by name. Only paper is implemented.
+
+    Adapters are created once per name and reused, so the paper state file
+    is loaded on first use rather than on every tool call.
+    """
     name = broker or "paper"
     if name != "paper":
         raise ValueError(f"Broker '{name}' is not yet supported. Use 'paper' for now.")
-    return PaperBroker()
+    adapter = _BROKERS.get(name)
+    if adapter is None:
+        adapter = _BROKERS[name] = PaperBroker()
+    return adapter
+
+
+def _reset_broker_cache() -> None:
+    """Drop cached broker adapters (used by tests that swap state files)."""
+    _BROKERS.clear()
+
+
+_CTX_CACHE: tuple[str, AuditLogger] | None = None
+_CTX_LOCK = threading.Lock()
 
 
 def _get_context() -> tuple[str, AuditLogger]:
-    """Get agent ID and audit logger for the current session."""
-    ensure_dirs()
-    agent = get_or_create_default_agent()
-    audit_path = get_agent_audit_path(agent.agent_id)
-    return agent.agent_id, AuditLogger(audit_path)
+    """Get agent ID and audit logger for the current session.
 
+    Resolved once per process; later calls reuse the same agent and logger,
+    which keeps its append fd open between tool calls. The logger re-reads
+    the chain tail whenever another process has appended to the same log.
+    """
+    global _CTX_CACHE
+    ctx = _CTX_CACHE
+    if ctx is not None:
+        return ctx
+    with _CTX_LOCK:
+        if _CTX_CACHE is None:
+            config.ensure_dirs()
+            agent = get_or_create_default_agent()
+            audit_path = get_agent_audit_path(agent.agent_id)
+            checkpoint_key = get_agent_checkpoint_key(agent.agent_id)
+            logger = AuditLogger(audit_path, checkpoint_key=checkpoint_key)
+            _CTX_CACHE = (agent.agent_id, logger)
+        return _CTX_CACHE
 
-def _mandate_hash(mandate_path_name: str = "default") -> str | None:
+
+def _reset_context_cache() -> None:
+    """Drop the cached session context and mandate engine (used by tests that swap directories)."""
+    global _CTX_CACHE, _ENGINE_CACHE
+    with _CTX_LOCK:
+        if _CTX_CACHE is not None:
+            _CTX_CACHE[1].close()
+        _CTX_CACHE = None
+    _ENGINE_CACHE = None
+
+
+def _file_identity(st: os.stat_result) -> tuple[int, int, int, int]:
+    """Stat fields that change whenever a file is rewritten or replaced."""
+    return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+# Mandate path -> (file identity, hash); rehashed only when the file changes
+_MANDATE_HASH_CACHE: dict[Path, tuple[tuple[int, int, int, int], str]] = {}
+
+
+def _mandate_hash(mandate_path: Path) -> str:
     """Compute hash of the mandate file for audit entries."""
-    path = MANDATES_DIR / f"{mandate_path_name}.yaml"
-    if not path.exists():
-        path = MANDATES_DIR / f"{mandate_path_name}.yml"
-    if not path.exists():
-        return None
-    return "sha256:" + hashlib.sha256(path.read_bytes()).hexdigest()
+    identity = _file_identity(mandate_path.stat())
+    cached = _MANDATE_HASH_CACHE.get(mandate_path)
+    if cached is not None and cached[0] == identity:
+        return cached[1]
+    with open(mandate_path, "rb") as f:
+        digest = "sha256:" + hashlib.file_digest(f, "sha256").hexdigest()
+    _MANDATE_HASH_CACHE[mandate_path] = (identity, digest)
+    return digest
+
+
+@functools.cache
+def _tool_semaphore() -> asyncio.Semaphore:
+    """Semaphore bounding tool calls in flight, sized on first use."""
+    return asyncio.Semaphore(config.get_max_concurrency())
+
+
+def _bounded(fn: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+    """Run a tool body under the shared concurrency limit."""
+
+    @functools.wraps(fn)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        async with _tool_semaphore():
+            return await fn(*args, **kwargs)
+
+    return wrapper
+
+
+# (path, file identity, engine, hash) for the last mandate loaded
+_ENGINE_CACHE: tuple[Path, tuple[int, int, int, int], MandateEngine, str] | None = None
+
+
+def _get_mandate_engine() -> tuple[MandateEngine, str]:
+    """Engine and file hash for the default mandate, reloaded only when it changes.
+
+    Raises FileNotFoundError when no mandate file exists.
+    """
+    global _ENGINE_CACHE
+    path = find_mandate_path(config.get_paths().mandates)
+    identity = _file_identity(path.stat())
+    cached = _ENGINE_CACHE
+    if cached is not None and cached[0] == path and cached[1] == identity:
+        return cached[2], cached[3]
+    engine = MandateEngine(load_mandate(path))
+    mhash = _mandate_hash(path)
+    _ENGINE_CACHE = (path, identity, engine, mhash)
+    return engine, mhash
 
 
 @mcp.tool()
+@_bounded
 async def get_quote(symbol: str, broker: str | None = None) -> dict:
     """Get current price quote for a symbol.
 
@@ -53,17 +163,19 @@ async def get_quote(symbol: str, broker: str | None = None) -> dict:
     agent_id, audit = _get_context()
     b = _get_broker(broker)
     quote = await b.get_quote(symbol)
+    dumped = quote.model_dump(mode="json")
 
     audit.log(
         agent_id=agent_id,
         action="get_quote",
         params={"symbol": symbol, "broker": broker or "paper"},
-        result=quote.model_dump(mode="json"),
+        result=dumped,
     )
-    return quote.model_dump(mode="json")
+    return dumped
 
 
 @mcp.tool()
+@_bounded
 async def get_positions(broker: str | None = None) -> list[dict]:
     """Get all current positions.
 
@@ -73,17 +185,19 @@ async def get_positions(broker: str | None = None) -> list[dict]:
     agent_id, audit = _get_context()
     b = _get_broker(broker)
     positions = await b.get_positions()
+    dumped = [p.model_dump(mode="json") for p in positions]
 
     audit.log(
         agent_id=agent_id,
         action="get_positions",
         params={"broker": broker or "paper"},
-        result={"positions": [p.model_dump(mode="json") for p in positions]},
+        result={"positions": dumped},
     )
-    return [p.model_dump(mode="json") for p in positions]
+    return dumped
 
 
 @mcp.tool()
+@_bounded
 async def get_account(broker: str | None = None) -> dict:
     """Get account balance, buying power, and portfolio value.
 
@@ -93,17 +207,19 @@ async def get_account(broker: str | None = None) -> dict:
     agent_id, audit = _get_context()
     b = _get_broker(broker)
     account = await b.get_account()
+    dumped = account.model_dump(mode="json")
 
     audit.log(
         agent_id=agent_id,
         action="get_account",
         params={"broker": broker or "paper"},
-        result=account.model_dump(mode="json"),
+        result=dumped,
     )
-    return account.model_dump(mode="json")
+    return dumped
 
 
 @mcp.tool()
+@_bounded
 async def place_order(
     symbol: str,
     qty: float,
@@ -111,6 +227,7 @@ async def place_order(
     order_type: str = "market",
     limit_price: float | None = None,
     broker: str | None = None,
+    verbose: bool = False,
 ) -> dict:
     """Place a trade order. Subject to mandate validation.
 
@@ -121,89 +238,101 @@ async def place_order(
         order_type: Order type - "market", "limit", or "stop"
         limit_price: Required for limit orders
         broker: Broker to use (default: paper)
+        verbose: Include every mandate check result when an order is blocked
     """
     agent_id, audit = _get_context()
     b = _get_broker(broker)
+    async with _ORDER_LOCK:
+        with b.price_snapshot():
+            # FastMCP only checks the tool signature, so the model's own
+            # validation is what guards the order. The enum members it's given
+            # are kept as-is, so their values can go straight into the params
+            order_side = Side(side)
+            kind = OrderType(order_type)
+            order = OrderRequest(
+                symbol=symbol.upper(),
+                qty=qty,
+                side=order_side,
+                order_type=kind,
+                limit_price=limit_price,
+                asset_type=AssetType.EQUITY,
+            )
 
-    order = OrderRequest(
-        symbol=symbol.upper(),
-        qty=qty,
-        side=Side(side),
-        order_type=OrderType(order_type),
-        limit_price=limit_price,
-        asset_type=AssetType.EQUITY,
-    )
+            params = {
+                "symbol": order.symbol,
+                "qty": order.qty,
+                "side": order_side.value,
+                "order_type": kind.value,
+                "limit_price": order.limit_price,
+            }
+
+            # Load mandate and run checks
+            mandate_id = None
+            mhash = None
+            try:
+                engine, mhash = _get_mandate_engine()
+                mandate_id = engine.mandate.mandate_id
+
+                # Build trading context from independent lookups; the daily
+                # stats scan reads the audit log off-loop
+                positions, account, quote, stats = await asyncio.gather(
+                    b.get_positions(),
+                    b.get_account(),
+                    b.get_quote(order.symbol),
+                    asyncio.to_thread(audit.get_daily_stats, agent_id),
+                )
+                daily_notional, daily_trade_count = stats
+
+                context = TradingContext(
+                    positions=positions,
+                    portfolio_value=account.portfolio_value,
+                    daily_notional=daily_notional,
+                    daily_trade_count=daily_trade_count,
+                    current_price=quote.price,
+                )
+
+                result = engine.evaluate(order, context)
+
+                if not result.passed:
+                    audit.log(
+                        agent_id=agent_id,
+                        action="place_order",
+                        params=params,
+                        mandate_id=mandate_id,
+                        mandate_hash=mhash,
+                        mandate_check="FAIL",
+                        mandate_reason=result.blocked_reason,
+                    )
+                    blocked = {
+                        "status": "blocked",
+                        "reason": result.blocked_reason,
+                        "message": f"Order blocked: {result.blocked_reason}. Adjust your strategy.",
+                    }
+                    if verbose:
+                        blocked["checks"] = [c.model_dump() for c in result.checks]
+                    return blocked
+            except FileNotFoundError:
+                # No mandate file — proceed without mandate checks
+                pass
+
+            # All checks passed (or no mandate) — send to broker
+            order_result = await b.place_order(order)
+            dumped = order_result.model_dump(mode="json")
 
-    params = {
-        "symbol": order.symbol,
-        "qty": order.qty,
-        "side": order.side.value,
-        "order_type": order.order_type.value,
-        "limit_price": order.limit_price,
-    }
-
-    # Load mandate and run checks
-    mandate_id = None
-    mhash = None
-    try:
-        mandate = load_mandate_from_dir(MANDATES_DIR)
-        mandate_id = mandate.mandate_id
-        mhash = _mandate_hash()
-
-        # Build trading context
-        positions = await b.get_positions()
-        account = await b.get_account()
-        quote = await b.get_quote(symbol)
-        daily_notional, daily_trade_count = audit.get_daily_stats(agent_id)
-
-        context = TradingContext(
-            positions=positions,
-            portfolio_value=account.portfolio_value,
-            daily_notional=daily_notional,
-            daily_trade_count=daily_trade_count,
-            current_time=datetime.now(UTC),
-            current_price=quote.price,
-        )
-
-        engine = MandateEngine(mandate)
-        result = engine.evaluate(order, context)
-
-        if not result.passed:
             audit.log(
                 agent_id=agent_id,
                 action="place_order",
                 params=params,
                 mandate_id=mandate_id,
                 mandate_hash=mhash,
-                mandate_check="FAIL",
-                mandate_reason=result.blocked_reason,
+                mandate_check="PASS" if mandate_id else None,
+                result=dumped,
             )
-            return {
-                "status": "blocked",
-                "reason": result.blocked_reason,
-                "message": f"Order blocked: {result.blocked_reason}. Adjust your strategy.",
-                "checks": [c.model_dump() for c in result.checks],
-            }
-    except FileNotFoundError:
-        # No mandate file — proceed without mandate checks
-        pass
-
-    # All checks passed (or no mandate) — send to broker
-    order_result = await b.place_order(order)
-
-    audit.log(
-        agent_id=agent_id,
-        action="place_order",
-        params=params,
-        mandate_id=mandate_id,
-        mandate_hash=mhash,
-        mandate_check="PASS" if mandate_id else None,
-        result=order_result.model_dump(mode="json"),
-    )
-    return order_result.model_dump(mode="json")
+            return dumped
 
 
 @mcp.tool()
+@_bounded
 async def cancel_order(order_id: str, broker: str | None = None) -> dict:
     """Cancel a pending order.
 
@@ -214,23 +343,27 @@ async def cancel_order(order_id: str, broker: str | None = None) -> dict:
     agent_id, audit = _get_context()
     b = _get_broker(broker)
     result = await b.cancel_order(order_id)
+    dumped = result.model_dump(mode="json")
 
     audit.log(
         agent_id=agent_id,
         action="cancel_order",
         params={"order_id": order_id, "broker": broker or "paper"},
-        result=result.model_dump(mode="json"),
+        result=dumped,
     )
-    return result.model_dump(mode="json")
+    return dumped
 
 
 @mcp.tool()
+@_bounded
 async def get_audit_log(n: int = 10) -> list[dict]:
     """Get recent audit log entries for the current agent.
 
+    Checkpoint entries are left out.
+
     Args:
         n: Number of recent entries to return (default: 10)
     """
     agent_id, audit = _get_context()
-    entries = audit.read_entries(last_n=n)
-    return [e.model_dump(mode="json") for e in entries]
+    # Stored lines are already JSON; return them without a model round trip
+    return audit.read_entries_raw(last_n=n, include_checkpoints=False)
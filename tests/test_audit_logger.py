@@ -48,6 +48,15 @@ def test_read_last_n(tmp_path: Path):
     assert last_2[1].action == "action_4"
 
 
+def test_read_entries_raw_matches_models(tmp_path: Path):
+    logger = AuditLogger(tmp_path / "audit.jsonl")
+    for i in range(3):
+        logger.log(agent_id="agt_test", action=f"action_{i}", params={"i": i})
+
+    raw = logger.read_entries_raw(last_n=2)
+    assert raw == [e.model_dump(mode="json") for e in logger.read_entries(last_n=2)]
+
+
 def test_logger_resumes_hash_chain(tmp_path: Path):
     log_path = tmp_path / "audit.jsonl"
 
@@ -76,3 +85,370 @@ def test_mandate_check_fields(tmp_path: Path):
     assert entry.mandate_check == "FAIL"
     assert entry.mandate_reason == "exceeds max concentration"
     assert entry.mandate_id == "mnd_abc123"
+
+
+def test_logger_resumes_hash_chain_past_tail_block(tmp_path: Path):
+    log_path = tmp_path / "audit.jsonl"
+
+    logger1 = AuditLogger(log_path)
+    for i in range(100):
+        last = logger1.log(agent_id="agt_test", action=f"action_{i}", params={"pad": "x" * 200})
+    assert log_path.stat().st_size > 8192
+
+    logger2 = AuditLogger(log_path)
+    e = logger2.log(agent_id="agt_test", action="resumed", params={})
+    assert e.prev_hash == last.entry_hash
+
+
+def test_daily_stats_counts_passed_orders(tmp_path: Path):
+    log_path = tmp_path / "audit.jsonl"
+    logger = AuditLogger(log_path)
+
+    def order(agent_id: str, check: str, price: float, qty: float) -> None:
+        logger.log(
+            agent_id=agent_id,
+            action="place_order",
+            params={"symbol": "AAPL", "qty": qty},
+            mandate_check=check,
+            result={"filled_price": price},
+        )
+
+    order("agt_test", "PASS", 100.0, 10)
+    order("agt_test", "FAIL", 100.0, 10)
+    order("agt_other", "PASS", 50.0, 1)
+    logger.log(agent_id="agt_test", action="get_quote", params={"symbol": "AAPL"})
+    assert logger.get_daily_stats("agt_test") == (1000.0, 1)
+
+    # Entries appended after the cache was written are picked up incrementally
+    order("agt_test", "PASS", 20.0, 5)
+    assert logger.get_daily_stats("agt_test") == (1100.0, 2)
+    assert AuditLogger(log_path).get_daily_stats("agt_other") == (50.0, 1)
+
+
+def test_daily_stats_cache_is_only_written_when_it_changes(tmp_path: Path, monkeypatch):
+    log_path = tmp_path / "audit.jsonl"
+    logger = AuditLogger(log_path)
+    logger.log(agent_id="agt_test", action="get_quote", params={"symbol": "AAPL"})
+
+    saved = []
+    save = AuditLogger._save_stats_cache
+    monkeypatch.setattr(
+        AuditLogger, "_save_stats_cache", lambda self, *args: saved.append(save(self, *args))
+    )
+    logger.get_daily_stats("agt_test")
+    logger.get_daily_stats("agt_test")
+    assert len(saved) == 1
+
+    logger.log(agent_id="agt_test", action="get_quote", params={"symbol": "AAPL"})
+    logger.get_daily_stats("agt_test")
+    assert len(saved) == 2
+    # Saved through a uniquely named temp file that doesn't linger
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_daily_stats_prefilter_matches_legacy_spaced_lines(tmp_path: Path):
+    import json
+
+    with AuditLogger(tmp_path / "compact.jsonl") as source:
+        source.log(
+            agent_id="agt_test",
+            action="place_order",
+            params={"qty": 10},
+            mandate_check="PASS",
+            result={"filled_price": 100.0},
+        )
+        compact = source.read_entries_raw()[0]
+    rejected = {**compact, "mandate_check": "FAIL"}
+
+    # Older loggers wrote stdlib json.dumps lines, with spaces after separators
+    log_path = tmp_path / "audit.jsonl"
+    log_path.write_text(f"{json.dumps(compact)}\n{json.dumps(rejected)}\n")
+    assert b'"action": "place_order"' in log_path.read_bytes()
+    logger = AuditLogger(log_path)
+    logger.log(
+        agent_id="agt_test",
+        action="place_order",
+        params={"qty": 1},
+        mandate_check="PASS",
+        result={"filled_price": 5.0},
+    )
+    assert AuditLogger(log_path).get_daily_stats("agt_test") == (1005.0, 2)
+
+
+def test_daily_stats_rebuilds_after_log_truncated(tmp_path: Path):
+    log_path = tmp_path / "audit.jsonl"
+    logger = AuditLogger(log_path)
+    logger.log(
+        agent_id="agt_test",
+        action="place_order",
+        params={"qty": 10},
+        mandate_check="PASS",
+        result={"filled_price": 100.0},
+    )
+    assert logger.get_daily_stats("agt_test") == (1000.0, 1)
+
+    log_path.write_text("")
+    assert AuditLogger(log_path).get_daily_stats("agt_test") == (0.0, 0)
+
+
+def test_logger_writes_signed_checkpoints(tmp_path: Path):
+    from vestbridge.audit.checkpoint import CHECKPOINT_ACTION, merkle_root, verify_checkpoint
+
+    log_path = tmp_path / "audit.jsonl"
+    key = b"k" * 32
+    logger = AuditLogger(log_path, checkpoint_key=key, checkpoint_every=4)
+
+    for i in range(10):
+        logger.log(agent_id="agt_test", action=f"action_{i}", params={})
+
+    entries = logger.read_entries()
+    checkpoints = [i for i, e in enumerate(entries) if e.action == CHECKPOINT_ACTION]
+    assert checkpoints == [4, 9]
+
+    checkpoint = entries[4]
+    root = merkle_root([e.entry_hash for e in entries[:4]])
+    assert checkpoint.params == {"merkle_root": root, "entries": 4}
+    assert verify_checkpoint(key, root, checkpoint.signature)
+
+
+def test_logger_resumes_pending_checkpoint_hashes(tmp_path: Path):
+    from vestbridge.audit.checkpoint import CHECKPOINT_ACTION
+
+    log_path = tmp_path / "audit.jsonl"
+    key = b"k" * 32
+
+    logger1 = AuditLogger(log_path, checkpoint_key=key, checkpoint_every=4)
+    for i in range(3):
+        logger1.log(agent_id="agt_test", action=f"action_{i}", params={})
+
+    logger2 = AuditLogger(log_path, checkpoint_key=key, checkpoint_every=4)
+    logger2.log(agent_id="agt_test", action="action_3", params={})
+
+    entries = logger2.read_entries()
+    assert entries[-1].action == CHECKPOINT_ACTION
+    assert entries[-1].params["entries"] == 4
+
+
+def test_read_entries_can_leave_out_checkpoints(tmp_path: Path):
+    logger = AuditLogger(tmp_path / "audit.jsonl", checkpoint_key=b"k" * 32, checkpoint_every=2)
+    for i in range(7):
+        logger.log(agent_id="agt_test", action=f"action_{i}", params={"action": "checkpoint"})
+
+    assert len(logger.read_entries()) == 10
+    entries = logger.read_entries(last_n=5, include_checkpoints=False)
+    assert [e.action for e in entries] == [f"action_{i}" for i in range(2, 7)]
+    raw = logger.read_entries_raw(last_n=20, include_checkpoints=False)
+    assert [e["action"] for e in raw] == [f"action_{i}" for i in range(7)]
+
+
+def test_written_line_hash_matches_canonical_hash(tmp_path: Path):
+    from vestbridge.audit.logger import compute_entry_hash, load_entry
+
+    log_path = tmp_path / "audit.jsonl"
+    logger = AuditLogger(log_path)
+    entry = logger.log(agent_id="agt_test", action="buy", params={"qty": 1.5, "symbol": "AAPL"})
+
+    stored = load_entry(log_path.read_bytes().strip())
+    assert stored == entry
+    assert compute_entry_hash(stored) == entry.entry_hash
+
+
+def test_logger_fsyncs_on_policy(tmp_path: Path, monkeypatch):
+    import os
+
+    synced = []
+    monkeypatch.setattr(os, "fsync", lambda fd: synced.append(fd))
+
+    with AuditLogger(tmp_path / "audit.jsonl", fsync_every=3) as logger:
+        for i in range(7):
+            logger.log(agent_id="agt_test", action=f"action_{i}", params={})
+        assert len(synced) == 2
+
+    # close() syncs the remaining entry
+    assert len(synced) == 3
+    assert len(logger.read_entries()) == 7
+
+
+def test_log_batch_chains_entries_in_one_write(tmp_path: Path):
+    from vestbridge.audit.verifier import AuditVerifier
+
+    log_path = tmp_path / "audit.jsonl"
+    logger = AuditLogger(log_path, checkpoint_key=b"k" * 32, checkpoint_every=4)
+    logger.log(agent_id="agt_test", action="first", params={})
+
+    entries = logger.log_batch(
+        [{"agent_id": "agt_test", "action": f"batch_{i}", "params": {"i": i}} for i in range(5)]
+    )
+    assert [e.action for e in entries] == [f"batch_{i}" for i in range(5)]
+
+    # The checkpoint after the fourth entry lands inside the batch
+    actions = [e.action for e in logger.read_entries()]
+    assert actions[4] == "checkpoint"
+    assert len(actions) == 7
+
+    result = AuditVerifier().verify(log_path, checkpoint_key=b"k" * 32)
+    assert result.valid
+
+
+def test_two_loggers_on_one_log_keep_one_chain(tmp_path: Path):
+    from vestbridge.audit.verifier import AuditVerifier
+
+    log_path = tmp_path / "audit.jsonl"
+    key = b"k" * 32
+    # As two server processes for the same agent would each hold one
+    first = AuditLogger(log_path, checkpoint_key=key, checkpoint_every=3)
+    second = AuditLogger(log_path, checkpoint_key=key, checkpoint_every=3)
+    for i in range(4):
+        first.log(agent_id="agt_test", action=f"first_{i}", params={})
+        second.log_batch([{"agent_id": "agt_test", "action": f"second_{i}", "params": {}}] * 2)
+
+    entries = first.read_entries()
+    assert all(e.prev_hash == p.entry_hash for p, e in zip(entries, entries[1:]))
+    # One checkpoint per three entries, whichever logger wrote them
+    assert [e.action for e in entries].count("checkpoint") == 4
+    assert AuditVerifier().verify(log_path, checkpoint_key=key).valid
+
+
+def test_logger_chains_from_entries_appended_behind_it(tmp_path: Path):
+    log_path = tmp_path / "audit.jsonl"
+    logger = AuditLogger(log_path)
+    logger.log(agent_id="agt_test", action="action_0", params={})
+
+    # Written by a logger that has since gone away, while this one kept its fd open
+    foreign = AuditLogger(log_path)
+    foreign.log(agent_id="agt_test", action="foreign", params={})
+    foreign.close()
+
+    entry = logger.log(agent_id="agt_test", action="action_1", params={})
+    assert entry.prev_hash == logger.read_entries()[1].entry_hash
+    assert [e.action for e in logger.read_entries(last_n=2)] == ["foreign", "action_1"]
+
+
+def test_read_last_n_uses_offset_index_without_writing_it(tmp_path: Path):
+    log_path = tmp_path / "audit.jsonl"
+    idx_path = log_path.with_suffix(".idx")
+    logger = AuditLogger(log_path)
+    for i in range(5):
+        logger.log(agent_id="agt_test", action=f"action_{i}", params={})
+    logger.close()
+    assert idx_path.stat().st_size == 5 * 8
+
+    # A missing index only costs readers a scan; they don't recreate it
+    idx_path.unlink()
+    assert [e.action for e in logger.read_entries(last_n=2)] == ["action_3", "action_4"]
+    assert not idx_path.exists()
+
+    # The next writer rebuilds it before appending
+    writer = AuditLogger(log_path)
+    writer.log(agent_id="agt_test", action="action_5", params={})
+    writer.close()
+    assert idx_path.stat().st_size == 6 * 8
+
+    # Entries appended by a writer that didn't maintain the index are picked up
+    with open(log_path, "ab") as f:
+        f.write(log_path.read_bytes().splitlines(keepends=True)[0])
+    assert logger.read_entries(last_n=1)[0].action == "action_0"
+    assert idx_path.stat().st_size == 6 * 8
+
+    # A log replaced by a shorter one invalidates the index
+    AuditLogger(tmp_path / "other.jsonl").log(agent_id="agt_test", action="other", params={})
+    (tmp_path / "other.jsonl").replace(log_path)
+    assert [e.action for e in logger.read_entries(last_n=3)] == ["other"]
+
+
+def test_out_of_order_index_is_ignored_and_rebuilt(tmp_path: Path):
+    import struct
+
+    log_path = tmp_path / "audit.jsonl"
+    idx_path = log_path.with_suffix(".idx")
+    with AuditLogger(log_path) as logger:
+        for i in range(4):
+            logger.log(agent_id="agt_test", action=f"action_{i}", params={})
+    good = idx_path.read_bytes()
+
+    # A duplicated record, as two processes indexing the same entry would leave
+    offsets = [offset for (offset,) in struct.iter_unpack("<Q", good)]
+    idx_path.write_bytes(struct.pack("<5Q", *offsets[:3], offsets[2], offsets[3]))
+    assert [e.action for e in logger.read_entries(last_n=2)] == ["action_2", "action_3"]
+
+    with AuditLogger(log_path) as writer:
+        writer.log(agent_id="agt_test", action="action_4", params={})
+    assert idx_path.read_bytes()[: len(good)] == good
+    assert idx_path.stat().st_size == 5 * 8
+
+
+def test_index_stays_exact_with_two_writers(tmp_path: Path):
+    log_path = tmp_path / "audit.jsonl"
+    idx_path = log_path.with_suffix(".idx")
+    first, second = AuditLogger(log_path), AuditLogger(log_path)
+    for i in range(3):
+        first.log(agent_id="agt_test", action=f"first_{i}", params={})
+        second.log_batch([{"agent_id": "agt_test", "action": f"second_{i}", "params": {}}] * 2)
+    lines = log_path.read_bytes().splitlines(keepends=True)
+    assert idx_path.stat().st_size == len(lines) * 8
+    assert [e.action for e in first.read_entries(last_n=3)] == ["first_2", "second_2", "second_2"]
+
+    # An index running past the end of a truncated log is ignored
+    log_path.write_bytes(b"".join(lines[:4]))
+    assert [e.action for e in first.read_entries(last_n=2)] == ["second_0", "first_1"]
+
+
+def test_readers_do_not_write_aggregate_sidecar(tmp_path: Path):
+    from vestbridge.audit.verifier import AuditVerifier
+
+    log_path = tmp_path / "audit.jsonl"
+    agg_path = log_path.with_suffix(".agg.bin")
+    with AuditLogger(log_path) as writer:
+        for i in range(3):
+            writer.log(agent_id="agt_test", action=f"action_{i}", params={})
+        # Not persisted per append, only at fsync points and on close
+        assert not agg_path.exists()
+    saved = agg_path.read_bytes()
+
+    # A stale sidecar is caught up in memory by readers, never rewritten
+    with open(log_path, "ab") as f:
+        f.write(log_path.read_bytes().splitlines(keepends=True)[0])
+    reader = AuditLogger(log_path)
+    reader.read_entries(last_n=2)
+    assert reader.aggregate == AuditVerifier().aggregate(log_path)
+    reader.close()
+    assert agg_path.read_bytes() == saved
+
+
+def test_aggregate_covers_entries_of_other_writers(tmp_path: Path):
+    from vestbridge.audit.verifier import AuditVerifier
+
+    log_path = tmp_path / "audit.jsonl"
+    first, second = AuditLogger(log_path), AuditLogger(log_path)
+    for i in range(3):
+        first.log(agent_id="agt_test", action=f"first_{i}", params={})
+        second.log(agent_id="agt_test", action=f"second_{i}", params={})
+    expected = AuditVerifier().aggregate(log_path)
+    assert first.aggregate == second.aggregate == expected
+
+    # Whichever logger saves last, the sidecar covers the whole log
+    second.close()
+    first.close()
+    assert AuditLogger(log_path).aggregate == expected
+
+
+def test_canonical_bytes_match_model_dump():
+    from datetime import UTC, datetime
+
+    import orjson
+
+    from vestbridge.audit.logger import CANONICAL_OPTIONS, canonical_bytes
+    from vestbridge.audit.models import AuditEntry
+    from vestbridge.brokers.base import Side
+
+    entry = AuditEntry(
+        event_id="evt_test",
+        timestamp=datetime(2026, 1, 2, 3, 4, 5, 678, tzinfo=UTC),
+        agent_id="agt_test",
+        action="place_order",
+        params={"side": Side.BUY, "qty": 1.5, "at": datetime(2026, 1, 2, tzinfo=UTC), 1: "x"},
+        result={"message": 'quote "\\u00e9"'},
+        prev_hash="sha256:abc",
+    )
+    payload = entry.model_dump(mode="json", exclude={"entry_hash", "signature"})
+    assert canonical_bytes(entry) == orjson.dumps(payload, option=CANONICAL_OPTIONS)
@@ -3,7 +3,7 @@
 import json
 from pathlib import Path
 
-from vestbridge.audit.logger import AuditLogger
+from vestbridge.audit.logger import AuditLogger, hash_payload
 from vestbridge.audit.verifier import AuditVerifier
 
 
@@ -61,13 +61,8 @@ def test_verify_detects_broken_chain(tmp_path: Path):
     entry = json.loads(lines[1])
     entry["prev_hash"] = "sha256:0000000000000000"
     # Recompute entry_hash with the bad prev_hash
-    import hashlib
-
     hashable = {k: v for k, v in entry.items() if k not in ("entry_hash", "signature")}
-    entry["entry_hash"] = (
-        "sha256:"
-        + hashlib.sha256(json.dumps(hashable, sort_keys=True, default=str).encode()).hexdigest()
-    )
+    entry["entry_hash"] = hash_payload(hashable)
     lines[1] = json.dumps(entry)
     log_path.write_text("\n".join(lines) + "\n")
 
@@ -75,3 +70,139 @@ def test_verify_detects_broken_chain(tmp_path: Path):
     result = verifier.verify(log_path)
     assert not result.valid
     assert "prev_hash mismatch" in result.first_error
+
+
+def test_verify_accepts_legacy_canonical_hashes(tmp_path: Path):
+    log_path = tmp_path / "audit.jsonl"
+    logger = AuditLogger(log_path)
+    entry = logger.log(agent_id="agt_test", action="action_0", params={"i": 0})
+
+    # Rewrite the entry as the stdlib-json logger used to hash it
+    entry.entry_hash = AuditVerifier._compute_legacy_hash(entry)
+    log_path.write_text(entry.model_dump_json() + "\n")
+    logger = AuditLogger(log_path)
+    logger.log(agent_id="agt_test", action="action_1", params={"i": 1})
+
+    result = AuditVerifier().verify(log_path)
+    assert result.valid
+    assert result.entries_checked == 2
+
+
+def test_parallel_verify_matches_sequential(tmp_path: Path, monkeypatch):
+    from vestbridge.audit import verifier as verifier_mod
+
+    monkeypatch.setattr(verifier_mod, "PARALLEL_MIN_BYTES", 0)
+    log_path = tmp_path / "audit.jsonl"
+    logger = AuditLogger(log_path)
+    for i in range(40):
+        logger.log(agent_id="agt_test", action=f"action_{i}", params={"i": i})
+
+    verifier = AuditVerifier()
+    result = verifier.verify(log_path, workers=4)
+    assert result.valid
+    assert result.entries_checked == 40
+
+    original = log_path.read_text().splitlines()
+    for index in (0, 9, 10, 25, 39):
+        lines = list(original)
+        entry = json.loads(lines[index])
+        entry["action"] = "TAMPERED"
+        lines[index] = json.dumps(entry)
+        log_path.write_text("\n".join(lines) + "\n")
+
+        parallel = verifier.verify(log_path, workers=4)
+        assert parallel == verifier.verify(log_path)
+        assert not parallel.valid
+        assert parallel.first_error.startswith(f"Entry {index + 1} ")
+
+
+def test_checkpoint_verify_accepts_signed_checkpoints(tmp_path: Path):
+    log_path = tmp_path / "audit.jsonl"
+    key = b"k" * 32
+    logger = AuditLogger(log_path, checkpoint_key=key, checkpoint_every=4)
+
+    for i in range(10):
+        logger.log(agent_id="agt_test", action=f"action_{i}", params={"i": i})
+
+    verifier = AuditVerifier()
+    full = verifier.verify(log_path)
+    checked = verifier.verify(log_path, checkpoint_key=key)
+    assert full.valid and checked.valid
+    assert checked.entries_checked == full.entries_checked == 12
+
+
+def test_checkpoint_verify_rejects_wrong_key(tmp_path: Path):
+    log_path = tmp_path / "audit.jsonl"
+    logger = AuditLogger(log_path, checkpoint_key=b"k" * 32, checkpoint_every=4)
+
+    for i in range(4):
+        logger.log(agent_id="agt_test", action=f"action_{i}", params={})
+
+    verifier = AuditVerifier()
+    result = verifier.verify(log_path, checkpoint_key=b"x" * 32)
+    assert not result.valid
+    assert "invalid checkpoint" in result.first_error
+
+
+def test_checkpoint_verify_rehashes_entries_after_last_checkpoint(tmp_path: Path):
+    log_path = tmp_path / "audit.jsonl"
+    key = b"k" * 32
+    logger = AuditLogger(log_path, checkpoint_key=key, checkpoint_every=4)
+
+    for i in range(6):
+        logger.log(agent_id="agt_test", action=f"action_{i}", params={})
+
+    lines = log_path.read_text().splitlines()
+    entry = json.loads(lines[-1])
+    entry["action"] = "TAMPERED"
+    lines[-1] = json.dumps(entry)
+    log_path.write_text("\n".join(lines) + "\n")
+
+    result = AuditVerifier().verify(log_path, checkpoint_key=key)
+    assert not result.valid
+    assert "hash mismatch" in result.first_error
+
+
+def test_checkpoint_verify_rehashes_checkpointed_entries(tmp_path: Path):
+    """A checkpoint signs entry hashes, so edited content under it must still fail."""
+    log_path = tmp_path / "audit.jsonl"
+    key = b"k" * 32
+    logger = AuditLogger(log_path, checkpoint_key=key, checkpoint_every=4)
+
+    for i in range(4):
+        logger.log(agent_id="agt_test", action="place_order", params={"qty": i + 1})
+
+    lines = log_path.read_text().splitlines()
+    entry = json.loads(lines[1])
+    entry["params"]["qty"] = 1000
+    lines[1] = json.dumps(entry)
+    log_path.write_text("\n".join(lines) + "\n")
+
+    result = AuditVerifier().verify(log_path, checkpoint_key=key)
+    assert not result.valid
+    assert result.entries_checked == 2
+    assert "hash mismatch" in result.first_error
+
+
+def test_aggregate_matches_logger_and_ignores_order(tmp_path: Path):
+    log_path = tmp_path / "audit.jsonl"
+    logger = AuditLogger(log_path)
+
+    for i in range(5):
+        logger.log(agent_id="agt_test", action=f"action_{i}", params={})
+
+    verifier = AuditVerifier()
+    assert verifier.aggregate(log_path) == logger.aggregate
+
+    reordered = tmp_path / "reordered.jsonl"
+    lines = log_path.read_text().splitlines()
+    reordered.write_text("\n".join(reversed(lines)) + "\n")
+    assert verifier.aggregate(reordered) == logger.aggregate
+
+    # The sidecar is persisted on close; a missing one is rebuilt in memory
+    logger.close()
+    agg_path = log_path.with_suffix(".agg.bin")
+    assert agg_path.exists()
+    agg_path.unlink()
+    assert AuditLogger(log_path).aggregate == logger.aggregate
+    assert not agg_path.exists()
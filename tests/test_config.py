@@ -0,0 +1,31 @@
+"""Tests for environment-driven settings."""
+
+import pytest
+
+from vestbridge import config
+
+
+@pytest.fixture(autouse=True)
+def _fresh_settings():
+    config.get_max_concurrency.cache_clear()
+    yield
+    config.get_max_concurrency.cache_clear()
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [(None, config.DEFAULT_MAX_CONCURRENCY), ("", config.DEFAULT_MAX_CONCURRENCY), ("4", 4)],
+)
+def test_max_concurrency(monkeypatch: pytest.MonkeyPatch, raw: str | None, expected: int):
+    if raw is None:
+        monkeypatch.delenv("VESTBRIDGE_MAX_CONCURRENCY", raising=False)
+    else:
+        monkeypatch.setenv("VESTBRIDGE_MAX_CONCURRENCY", raw)
+    assert config.get_max_concurrency() == expected
+
+
+@pytest.mark.parametrize("raw", ["0", "-2", "abc", "1.5"])
+def test_max_concurrency_rejects_invalid_values(monkeypatch: pytest.MonkeyPatch, raw: str):
+    monkeypatch.setenv("VESTBRIDGE_MAX_CONCURRENCY", raw)
+    with pytest.raises(ValueError, match="VESTBRIDGE_MAX_CONCURRENCY"):
+        config.get_max_concurrency()
@@ -3,6 +3,9 @@
 from datetime import UTC, datetime
 from zoneinfo import ZoneInfo
 
+import pytest
+from pydantic import ValidationError
+
 from vestbridge.brokers.base import AssetType, OrderRequest, OrderType, Position, Side
 from vestbridge.mandate.checks.asset_type import AssetTypeCheck
 from vestbridge.mandate.checks.concentration import ConcentrationCheck
@@ -13,17 +16,22 @@ from vestbridge.mandate.checks.trading_hours import OrderTypeCheck, SideCheck, T
 from vestbridge.mandate.engine import MandateEngine, TradingContext
 from vestbridge.mandate.models import Mandate, MandatePermissions
 
+# Validated once; variants are shallow copies with the requested fields swapped in
+_BASE_ORDER = OrderRequest(
+    symbol="AAPL", qty=10, side=Side.BUY, order_type=OrderType.MARKET, asset_type=AssetType.EQUITY
+)
+# Monday 10:00 ET, so results never depend on when the suite runs
+_NOW = datetime(2024, 1, 15, 15, 0, tzinfo=UTC)
 
-def make_order(
-    symbol: str = "AAPL",
-    qty: float = 10,
-    side: Side = Side.BUY,
-    order_type: OrderType = OrderType.MARKET,
-    asset_type: AssetType = AssetType.EQUITY,
-) -> OrderRequest:
-    return OrderRequest(
-        symbol=symbol, qty=qty, side=side, order_type=order_type, asset_type=asset_type
-    )
+_ET = ZoneInfo("America/New_York")
+# 2024-01-15 is a Monday; 2024-01-13 is the Saturday before it
+_MARKET_TIME = datetime(2024, 1, 15, 10, 0, tzinfo=_ET)
+_AFTER_HOURS = datetime(2024, 1, 15, 17, 0, tzinfo=_ET)
+_SATURDAY = datetime(2024, 1, 13, 10, 0, tzinfo=_ET)
+
+
+def make_order(**overrides) -> OrderRequest:
+    return _BASE_ORDER.model_copy(update=overrides) if overrides else _BASE_ORDER
 
 
 def make_context(
@@ -40,304 +48,408 @@ def make_context(
         current_price=current_price,
         daily_notional=daily_notional,
         daily_trade_count=daily_trade_count,
-        current_time=current_time or datetime.now(UTC),
+        current_time=current_time or _NOW,
     )
 
 
-# --- OrderSizeCheck ---
+def assert_check(check, order_kw: dict, perms, ctx_kw: dict, reason: str | None) -> None:
+    result = check.evaluate(make_order(**order_kw), perms, make_context(**ctx_kw))
+    if reason is None:
+        assert result.passed
+    else:
+        assert not result.passed
+        assert reason.lower() in result.reason.lower()
 
 
-class TestOrderSizeCheck:
-    def test_pass_when_no_limit(self):
-        check = OrderSizeCheck()
-        perms = MandatePermissions()
-        result = check.evaluate(make_order(), perms, make_context())
-        assert result.passed
+# Each case: (order overrides, permissions, context overrides, expected reason
+# fragment or None when the check should pass)
 
-    def test_pass_within_limit(self):
-        check = OrderSizeCheck()
-        perms = MandatePermissions(max_order_size_usd=10000)
-        result = check.evaluate(make_order(qty=10), perms, make_context(current_price=150))
-        assert result.passed  # 10 * 150 = 1500
 
-    def test_fail_exceeds_limit(self):
-        check = OrderSizeCheck()
-        perms = MandatePermissions(max_order_size_usd=1000)
-        result = check.evaluate(make_order(qty=10), perms, make_context(current_price=150))
-        assert not result.passed
-        assert "exceeds max order size" in result.reason
+# --- OrderSizeCheck ---
 
 
-# --- ConcentrationCheck ---
+class TestOrderSizeCheck:
+    check = OrderSizeCheck()
+
+    @pytest.mark.parametrize(
+        ("order_kw", "perms", "ctx_kw", "reason"),
+        [
+            pytest.param({}, MandatePermissions(), {}, None, id="no_limit"),
+            pytest.param(
+                {"qty": 10},
+                MandatePermissions(max_order_size_usd=10000),
+                {"current_price": 150},
+                None,
+                id="within_limit",  # 10 * 150 = 1500
+            ),
+            pytest.param(
+                {"qty": 10},
+                MandatePermissions(max_order_size_usd=1000),
+                {"current_price": 150},
+                "exceeds max order size",
+                id="exceeds_limit",
+            ),
+        ],
+    )
+    def test_evaluate(self, order_kw, perms, ctx_kw, reason):
+        assert_check(self.check, order_kw, perms, ctx_kw, reason)
 
 
-class TestConcentrationCheck:
-    def test_pass_when_no_limit(self):
-        check = ConcentrationCheck()
-        perms = MandatePermissions()
-        result = check.evaluate(make_order(), perms, make_context())
-        assert result.passed
+# --- ConcentrationCheck ---
 
-    def test_pass_within_limit(self):
-        check = ConcentrationCheck()
-        perms = MandatePermissions(max_concentration_pct=20)
-        # 10 * 150 = 1500, 1.5% of 100k
-        result = check.evaluate(make_order(qty=10), perms, make_context(current_price=150))
-        assert result.passed
+_AAPL_POSITION = Position(
+    symbol="AAPL",
+    qty=100,
+    avg_cost=150,
+    current_price=150,
+    market_value=15000,
+    unrealized_pnl=0,
+)
 
-    def test_fail_exceeds_limit(self):
-        check = ConcentrationCheck()
-        perms = MandatePermissions(max_concentration_pct=20)
-        existing = Position(
-            symbol="AAPL",
-            qty=100,
-            avg_cost=150,
-            current_price=150,
-            market_value=15000,
-            unrealized_pnl=0,
-        )
-        # existing 15000 + 100*150=15000 = 30000, 30% of 100k
-        result = check.evaluate(
-            make_order(qty=100),
-            perms,
-            make_context(current_price=150, positions=[existing]),
-        )
-        assert not result.passed
-        assert "concentration" in result.reason
+
+class TestConcentrationCheck:
+    check = ConcentrationCheck()
+
+    @pytest.mark.parametrize(
+        ("order_kw", "perms", "ctx_kw", "reason"),
+        [
+            pytest.param({}, MandatePermissions(), {}, None, id="no_limit"),
+            pytest.param(
+                {"qty": 10},
+                MandatePermissions(max_concentration_pct=20),
+                {"current_price": 150},
+                None,
+                id="within_limit",  # 10 * 150 = 1500, 1.5% of 100k
+            ),
+            pytest.param(
+                {"qty": 100},
+                MandatePermissions(max_concentration_pct=20),
+                {"current_price": 150, "positions": [_AAPL_POSITION]},
+                "concentration",
+                id="exceeds_limit",  # existing 15000 + 100*150 = 30000, 30% of 100k
+            ),
+        ],
+    )
+    def test_evaluate(self, order_kw, perms, ctx_kw, reason):
+        assert_check(self.check, order_kw, perms, ctx_kw, reason)
 
 
 # --- SymbolAllowlistCheck ---
 
 
 class TestSymbolAllowlistCheck:
-    def test_pass_when_no_list(self):
-        check = SymbolAllowlistCheck()
-        perms = MandatePermissions()
-        result = check.evaluate(make_order(), perms, make_context())
-        assert result.passed
+    check = SymbolAllowlistCheck()
+
+    @pytest.mark.parametrize(
+        ("order_kw", "perms", "ctx_kw", "reason"),
+        [
+            pytest.param({}, MandatePermissions(), {}, None, id="no_list"),
+            pytest.param(
+                {"symbol": "AAPL"},
+                MandatePermissions(allowed_symbols=["AAPL", "MSFT"]),
+                {},
+                None,
+                id="in_allowlist",
+            ),
+            pytest.param(
+                {"symbol": "AAPL"},
+                MandatePermissions(allowed_symbols=["MSFT", "GOOG"]),
+                {},
+                "not in allowed symbols",
+                id="not_in_allowlist",
+            ),
+            pytest.param(
+                {"symbol": "Aapl"},
+                MandatePermissions(allowed_symbols=["aapl"]),
+                {},
+                None,
+                id="case_insensitive",
+            ),
+        ],
+    )
+    def test_evaluate(self, order_kw, perms, ctx_kw, reason):
+        assert_check(self.check, order_kw, perms, ctx_kw, reason)
 
-    def test_pass_in_allowlist(self):
-        check = SymbolAllowlistCheck()
-        perms = MandatePermissions(allowed_symbols=["AAPL", "MSFT"])
-        result = check.evaluate(make_order(symbol="AAPL"), perms, make_context())
-        assert result.passed
+    def test_copied_permissions_use_their_own_list(self):
+        perms = MandatePermissions(allowed_symbols=["AAPL"])
+        assert_check(self.check, {"symbol": "AAPL"}, perms, {}, None)
+        copied = perms.model_copy(update={"allowed_symbols": ["MSFT"]})
+        assert_check(self.check, {"symbol": "AAPL"}, copied, {}, "not in allowed symbols")
 
-    def test_fail_not_in_allowlist(self):
-        check = SymbolAllowlistCheck()
-        perms = MandatePermissions(allowed_symbols=["MSFT", "GOOG"])
-        result = check.evaluate(make_order(symbol="AAPL"), perms, make_context())
-        assert not result.passed
-        assert "not in allowed symbols" in result.reason
+    def test_constructed_permissions_are_enforced(self):
+        perms = MandatePermissions.model_construct(allowed_symbols=["MSFT"])
+        assert_check(self.check, {"symbol": "AAPL"}, perms, {}, "not in allowed symbols")
+
+    def test_permissions_are_frozen(self):
+        perms = MandatePermissions(allowed_symbols=["AAPL"])
+        with pytest.raises(ValidationError):
+            perms.allowed_symbols = ["MSFT"]
 
 
 # --- SymbolBlocklistCheck ---
 
 
 class TestSymbolBlocklistCheck:
-    def test_pass_when_no_list(self):
-        check = SymbolBlocklistCheck()
-        perms = MandatePermissions()
-        result = check.evaluate(make_order(), perms, make_context())
-        assert result.passed
-
-    def test_pass_not_blocked(self):
-        check = SymbolBlocklistCheck()
-        perms = MandatePermissions(blocked_symbols=["GME", "AMC"])
-        result = check.evaluate(make_order(symbol="AAPL"), perms, make_context())
-        assert result.passed
-
-    def test_fail_blocked(self):
-        check = SymbolBlocklistCheck()
-        perms = MandatePermissions(blocked_symbols=["GME", "AMC"])
-        result = check.evaluate(make_order(symbol="GME"), perms, make_context())
-        assert not result.passed
-        assert "blocked" in result.reason
+    check = SymbolBlocklistCheck()
+
+    @pytest.mark.parametrize(
+        ("order_kw", "perms", "ctx_kw", "reason"),
+        [
+            pytest.param({}, MandatePermissions(), {}, None, id="no_list"),
+            pytest.param(
+                {"symbol": "AAPL"},
+                MandatePermissions(blocked_symbols=["GME", "AMC"]),
+                {},
+                None,
+                id="not_blocked",
+            ),
+            pytest.param(
+                {"symbol": "GME"},
+                MandatePermissions(blocked_symbols=["GME", "AMC"]),
+                {},
+                "blocked",
+                id="blocked",
+            ),
+        ],
+    )
+    def test_evaluate(self, order_kw, perms, ctx_kw, reason):
+        assert_check(self.check, order_kw, perms, ctx_kw, reason)
 
 
 # --- AssetTypeCheck ---
 
 
 class TestAssetTypeCheck:
-    def test_pass_when_no_list(self):
-        check = AssetTypeCheck()
-        perms = MandatePermissions()
-        result = check.evaluate(make_order(), perms, make_context())
-        assert result.passed
-
-    def test_pass_allowed(self):
-        check = AssetTypeCheck()
-        perms = MandatePermissions(allowed_asset_types=["equity"])
-        result = check.evaluate(make_order(asset_type=AssetType.EQUITY), perms, make_context())
-        assert result.passed
-
-    def test_fail_not_allowed(self):
-        check = AssetTypeCheck()
-        perms = MandatePermissions(allowed_asset_types=["equity"])
-        result = check.evaluate(make_order(asset_type=AssetType.OPTION), perms, make_context())
-        assert not result.passed
-        assert "not allowed" in result.reason
+    check = AssetTypeCheck()
+
+    @pytest.mark.parametrize(
+        ("order_kw", "perms", "ctx_kw", "reason"),
+        [
+            pytest.param({}, MandatePermissions(), {}, None, id="no_list"),
+            pytest.param(
+                {"asset_type": AssetType.EQUITY},
+                MandatePermissions(allowed_asset_types=["equity"]),
+                {},
+                None,
+                id="allowed",
+            ),
+            pytest.param(
+                {"asset_type": AssetType.OPTION},
+                MandatePermissions(allowed_asset_types=["equity"]),
+                {},
+                "not allowed",
+                id="not_allowed",
+            ),
+        ],
+    )
+    def test_evaluate(self, order_kw, perms, ctx_kw, reason):
+        assert_check(self.check, order_kw, perms, ctx_kw, reason)
 
 
 # --- DailyVolumeCheck ---
 
 
 class TestDailyVolumeCheck:
-    def test_pass_when_no_limit(self):
-        check = DailyVolumeCheck()
-        perms = MandatePermissions()
-        result = check.evaluate(make_order(), perms, make_context())
-        assert result.passed
-
-    def test_pass_within_limit(self):
-        check = DailyVolumeCheck()
-        perms = MandatePermissions(max_daily_notional_usd=50000)
-        result = check.evaluate(make_order(qty=10), perms, make_context(current_price=150))
-        assert result.passed
-
-    def test_fail_exceeds_limit(self):
-        check = DailyVolumeCheck()
-        perms = MandatePermissions(max_daily_notional_usd=50000)
-        result = check.evaluate(
-            make_order(qty=10),
-            perms,
-            make_context(current_price=150, daily_notional=49000),
-        )
-        assert not result.passed
-        assert "Daily notional" in result.reason
+    check = DailyVolumeCheck()
+
+    @pytest.mark.parametrize(
+        ("order_kw", "perms", "ctx_kw", "reason"),
+        [
+            pytest.param({}, MandatePermissions(), {}, None, id="no_limit"),
+            pytest.param(
+                {"qty": 10},
+                MandatePermissions(max_daily_notional_usd=50000),
+                {"current_price": 150},
+                None,
+                id="within_limit",
+            ),
+            pytest.param(
+                {"qty": 10},
+                MandatePermissions(max_daily_notional_usd=50000),
+                {"current_price": 150, "daily_notional": 49000},
+                "Daily notional",
+                id="exceeds_limit",
+            ),
+        ],
+    )
+    def test_evaluate(self, order_kw, perms, ctx_kw, reason):
+        assert_check(self.check, order_kw, perms, ctx_kw, reason)
 
 
 # --- DailyTradeCountCheck ---
 
 
 class TestDailyTradeCountCheck:
-    def test_pass_when_no_limit(self):
-        check = DailyTradeCountCheck()
-        perms = MandatePermissions()
-        result = check.evaluate(make_order(), perms, make_context())
-        assert result.passed
-
-    def test_pass_within_limit(self):
-        check = DailyTradeCountCheck()
-        perms = MandatePermissions(max_daily_trades=10)
-        result = check.evaluate(make_order(), perms, make_context(daily_trade_count=5))
-        assert result.passed
-
-    def test_fail_exceeds_limit(self):
-        check = DailyTradeCountCheck()
-        perms = MandatePermissions(max_daily_trades=5)
-        result = check.evaluate(make_order(), perms, make_context(daily_trade_count=5))
-        assert not result.passed
-        assert "Already placed 5 trades" in result.reason
+    check = DailyTradeCountCheck()
+
+    @pytest.mark.parametrize(
+        ("order_kw", "perms", "ctx_kw", "reason"),
+        [
+            pytest.param({}, MandatePermissions(), {}, None, id="no_limit"),
+            pytest.param(
+                {},
+                MandatePermissions(max_daily_trades=10),
+                {"daily_trade_count": 5},
+                None,
+                id="within_limit",
+            ),
+            pytest.param(
+                {},
+                MandatePermissions(max_daily_trades=5),
+                {"daily_trade_count": 5},
+                "Already placed 5 trades",
+                id="exceeds_limit",
+            ),
+        ],
+    )
+    def test_evaluate(self, order_kw, perms, ctx_kw, reason):
+        assert_check(self.check, order_kw, perms, ctx_kw, reason)
 
 
 # --- TradingHoursCheck ---
 
 
 class TestTradingHoursCheck:
-    def test_pass_when_not_enforced(self):
-        check = TradingHoursCheck()
-        perms = MandatePermissions(trading_hours_only=False)
-        result = check.evaluate(make_order(), perms, make_context())
-        assert result.passed
-
-    def test_pass_during_market_hours(self):
-        check = TradingHoursCheck()
-        perms = MandatePermissions(trading_hours_only=True)
-        # 2024-01-15 is a Monday, set to 10:00 ET
-        et = ZoneInfo("America/New_York")
-        market_time = datetime(2024, 1, 15, 10, 0, tzinfo=et)
-        result = check.evaluate(make_order(), perms, make_context(current_time=market_time))
-        assert result.passed
+    check = TradingHoursCheck()
 
-    def test_fail_outside_market_hours(self):
-        check = TradingHoursCheck()
-        perms = MandatePermissions(trading_hours_only=True)
-        et = ZoneInfo("America/New_York")
-        after_hours = datetime(2024, 1, 15, 17, 0, tzinfo=et)
-        result = check.evaluate(make_order(), perms, make_context(current_time=after_hours))
-        assert not result.passed
-        assert "Outside market hours" in result.reason
-
-    def test_fail_on_weekend(self):
-        check = TradingHoursCheck()
-        perms = MandatePermissions(trading_hours_only=True)
-        et = ZoneInfo("America/New_York")
-        saturday = datetime(2024, 1, 13, 10, 0, tzinfo=et)  # Saturday
-        result = check.evaluate(make_order(), perms, make_context(current_time=saturday))
-        assert not result.passed
-        assert "weekdays" in result.reason
+    @pytest.mark.parametrize(
+        ("order_kw", "perms", "ctx_kw", "reason"),
+        [
+            pytest.param(
+                {}, MandatePermissions(trading_hours_only=False), {}, None, id="not_enforced"
+            ),
+            pytest.param(
+                {},
+                MandatePermissions(trading_hours_only=True),
+                {"current_time": _MARKET_TIME},
+                None,
+                id="market_hours",
+            ),
+            pytest.param(
+                {},
+                MandatePermissions(trading_hours_only=True),
+                {"current_time": _AFTER_HOURS},
+                "Outside market hours",
+                id="outside_market_hours",
+            ),
+            pytest.param(
+                {},
+                MandatePermissions(trading_hours_only=True),
+                {"current_time": _SATURDAY},
+                "weekdays",
+                id="weekend",
+            ),
+        ],
+    )
+    def test_evaluate(self, order_kw, perms, ctx_kw, reason):
+        assert_check(self.check, order_kw, perms, ctx_kw, reason)
 
 
 # --- OrderTypeCheck ---
 
 
 class TestOrderTypeCheck:
-    def test_pass_when_no_list(self):
-        check = OrderTypeCheck()
-        perms = MandatePermissions()
-        result = check.evaluate(make_order(), perms, make_context())
-        assert result.passed
-
-    def test_pass_allowed(self):
-        check = OrderTypeCheck()
-        perms = MandatePermissions(allowed_order_types=["market", "limit"])
-        result = check.evaluate(make_order(order_type=OrderType.MARKET), perms, make_context())
-        assert result.passed
-
-    def test_fail_not_allowed(self):
-        check = OrderTypeCheck()
-        perms = MandatePermissions(allowed_order_types=["limit"])
-        result = check.evaluate(make_order(order_type=OrderType.MARKET), perms, make_context())
-        assert not result.passed
+    check = OrderTypeCheck()
+
+    @pytest.mark.parametrize(
+        ("order_kw", "perms", "ctx_kw", "reason"),
+        [
+            pytest.param({}, MandatePermissions(), {}, None, id="no_list"),
+            pytest.param(
+                {"order_type": OrderType.MARKET},
+                MandatePermissions(allowed_order_types=["market", "limit"]),
+                {},
+                None,
+                id="allowed",
+            ),
+            pytest.param(
+                {"order_type": OrderType.MARKET},
+                MandatePermissions(allowed_order_types=["limit"]),
+                {},
+                "not allowed",
+                id="not_allowed",
+            ),
+        ],
+    )
+    def test_evaluate(self, order_kw, perms, ctx_kw, reason):
+        assert_check(self.check, order_kw, perms, ctx_kw, reason)
 
 
 # --- SideCheck ---
 
 
 class TestSideCheck:
-    def test_pass_when_no_list(self):
-        check = SideCheck()
-        perms = MandatePermissions()
-        result = check.evaluate(make_order(), perms, make_context())
-        assert result.passed
-
-    def test_pass_allowed(self):
-        check = SideCheck()
-        perms = MandatePermissions(allowed_sides=["buy", "sell"])
-        result = check.evaluate(make_order(side=Side.BUY), perms, make_context())
-        assert result.passed
-
-    def test_fail_not_allowed(self):
-        check = SideCheck()
-        perms = MandatePermissions(allowed_sides=["buy"])
-        result = check.evaluate(make_order(side=Side.SHORT), perms, make_context())
-        assert not result.passed
+    check = SideCheck()
+
+    @pytest.mark.parametrize(
+        ("order_kw", "perms", "ctx_kw", "reason"),
+        [
+            pytest.param({}, MandatePermissions(), {}, None, id="no_list"),
+            pytest.param(
+                {"side": Side.BUY},
+                MandatePermissions(allowed_sides=["buy", "sell"]),
+                {},
+                None,
+                id="allowed",
+            ),
+            pytest.param(
+                {"side": Side.SHORT},
+                MandatePermissions(allowed_sides=["buy"]),
+                {},
+                "not allowed",
+                id="not_allowed",
+            ),
+        ],
+    )
+    def test_evaluate(self, order_kw, perms, ctx_kw, reason):
+        assert_check(self.check, order_kw, perms, ctx_kw, reason)
 
 
 # --- PortfolioPercentCheck ---
 
 
 class TestPortfolioPercentCheck:
-    def test_pass_when_no_limit(self):
-        check = PortfolioPercentCheck()
-        perms = MandatePermissions()
-        result = check.evaluate(make_order(), perms, make_context())
-        assert result.passed
+    check = PortfolioPercentCheck()
+
+    @pytest.mark.parametrize(
+        ("order_kw", "perms", "ctx_kw", "reason"),
+        [
+            pytest.param({}, MandatePermissions(), {}, None, id="no_limit"),
+            pytest.param(
+                {"qty": 10},
+                MandatePermissions(max_portfolio_pct_per_order=10),
+                {"current_price": 150},
+                None,
+                id="within_limit",  # 10 * 150 = 1500, 1.5% of 100k
+            ),
+            pytest.param(
+                {"qty": 100},
+                MandatePermissions(max_portfolio_pct_per_order=5),
+                {"current_price": 150},
+                "portfolio",
+                id="exceeds_limit",  # 100 * 150 = 15000, 15% of 100k
+            ),
+        ],
+    )
+    def test_evaluate(self, order_kw, perms, ctx_kw, reason):
+        assert_check(self.check, order_kw, perms, ctx_kw, reason)
 
-    def test_pass_within_limit(self):
-        check = PortfolioPercentCheck()
-        perms = MandatePermissions(max_portfolio_pct_per_order=10)
-        # 10 * 150 = 1500, 1.5% of 100k
-        result = check.evaluate(make_order(qty=10), perms, make_context(current_price=150))
-        assert result.passed
 
-    def test_fail_exceeds_limit(self):
-        check = PortfolioPercentCheck()
-        perms = MandatePermissions(max_portfolio_pct_per_order=5)
-        # 100 * 150 = 15000, 15% of 100k
-        result = check.evaluate(make_order(qty=100), perms, make_context(current_price=150))
-        assert not result.passed
-        assert "portfolio" in result.reason.lower()
+# --- TradingContext ---
+
+
+class TestTradingContext:
+    def test_current_time_defaults_to_now(self):
+        # make_context pins the clock to _NOW; the real default reads it lazily
+        before = datetime.now(UTC)
+        context = TradingContext(positions=[], portfolio_value=100_000)
+        assert before <= context.current_time <= datetime.now(UTC)
+        assert context.current_time is context.current_time
+
+    def test_current_time_is_assignable(self):
+        context = make_context()
+        context.current_time = _SATURDAY
+        assert context.current_time is _SATURDAY
 
 
 # --- MandateEngine ---
@@ -358,6 +470,19 @@ class TestMandateEngine:
         assert result.passed
         assert result.blocked_reason is None
 
+    def test_passing_results_are_shared(self):
+        perms = MandatePermissions(max_order_size_usd=100000, allowed_sides=["buy"])
+        engine = MandateEngine(Mandate(mandate_id="test", permissions=perms))
+        first = engine.evaluate(make_order(), make_context())
+        second = engine.evaluate(make_order(), make_context())
+        assert all(a is b for a, b in zip(first.checks, second.checks, strict=True))
+
+    def test_unset_permissions_are_not_checked(self):
+        perms = MandatePermissions(max_order_size_usd=100000, allowed_sides=["buy"])
+        engine = MandateEngine(Mandate(mandate_id="test", permissions=perms))
+        result = engine.evaluate(make_order(), make_context())
+        assert [c.check_name for c in result.checks] == ["side", "order_size"]
+
     def test_one_fails(self):
         mandate = Mandate(
             mandate_id="test",
@@ -386,3 +511,30 @@ class TestMandateEngine:
         assert not result.passed
         failed_checks = [c for c in result.checks if not c.passed]
         assert len(failed_checks) >= 2
+
+    def test_repeat_evaluation_is_cached(self):
+        perms = MandatePermissions(max_daily_trades=3)
+        engine = MandateEngine(Mandate(mandate_id="test", permissions=perms))
+        first = engine.evaluate(make_order(), make_context(daily_trade_count=1))
+        assert engine.evaluate(make_order(), make_context(daily_trade_count=1)) is first
+        blocked = engine.evaluate(make_order(), make_context(daily_trade_count=3))
+        assert first.passed
+        assert not blocked.passed
+
+    def test_evaluate_many_accumulates_daily_totals(self):
+        perms = MandatePermissions(max_daily_notional_usd=2500, max_daily_trades=3)
+        engine = MandateEngine(Mandate(mandate_id="test", permissions=perms))
+        orders = [make_order(symbol="AAPL"), make_order(symbol="MSFT"), make_order(symbol="GOOG")]
+        prices = {"AAPL": 100.0, "MSFT": 200.0, "GOOG": 50.0}
+        results = engine.evaluate_many(orders, make_context(daily_trade_count=1), prices)
+        # AAPL takes notional to 1000; MSFT would reach 3000 and is blocked, so
+        # GOOG is checked against 1000 and reaches 1500.
+        assert [r.passed for r in results] == [True, False, True]
+
+    def test_fast_fail_stops_at_first_failure(self):
+        perms = MandatePermissions(max_order_size_usd=100, blocked_symbols=["AAPL"])
+        engine = MandateEngine(Mandate(mandate_id="test", permissions=perms))
+        result = engine.evaluate(make_order(symbol="AAPL", qty=10), make_context(), fast_fail=True)
+        assert not result.passed
+        assert [c.check_name for c in result.checks] == ["symbol_blocklist"]
+        assert result.blocked_reason == "AAPL is in blocked symbols list"
@@ -13,24 +13,27 @@ def broker(tmp_path: Path) -> PaperBroker:
     return PaperBroker(state_path=tmp_path / "paper_state.json")
 
 
-@pytest.mark.asyncio
-async def test_initial_account(broker: PaperBroker):
-    account = await broker.get_account()
+@pytest.fixture(scope="module")
+def shared_broker(tmp_path_factory: pytest.TempPathFactory) -> PaperBroker:
+    """One broker for tests that only read state; mutating tests use ``broker``."""
+    return PaperBroker(state_path=tmp_path_factory.mktemp("broker") / "paper_state.json")
+
+
+async def test_initial_account(shared_broker: PaperBroker):
+    account = await shared_broker.get_account()
     assert account.cash_balance == 100_000.0
     assert account.portfolio_value == 100_000.0
     assert account.positions_value == 0.0
 
 
-@pytest.mark.asyncio
-async def test_get_quote(broker: PaperBroker):
-    quote = await broker.get_quote("AAPL")
+async def test_get_quote(shared_broker: PaperBroker):
+    quote = await shared_broker.get_quote("AAPL")
     assert quote.symbol == "AAPL"
     assert quote.price > 0
     assert quote.bid is not None
     assert quote.ask is not None
 
 
-@pytest.mark.asyncio
 async def test_buy_order(broker: PaperBroker):
     order = OrderRequest(symbol="AAPL", qty=10, side=Side.BUY, order_type=OrderType.MARKET)
     result = await broker.place_order(order)
@@ -47,7 +50,6 @@ async def test_buy_order(broker: PaperBroker):
     assert account.cash_balance < 100_000.0
 
 
-@pytest.mark.asyncio
 async def test_sell_order(broker: PaperBroker):
     # Buy first
     buy = OrderRequest(symbol="AAPL", qty=10, side=Side.BUY, order_type=OrderType.MARKET)
@@ -62,7 +64,6 @@ async def test_sell_order(broker: PaperBroker):
     assert positions[0].qty == 5
 
 
-@pytest.mark.asyncio
 async def test_sell_all_removes_position(broker: PaperBroker):
     buy = OrderRequest(symbol="AAPL", qty=10, side=Side.BUY, order_type=OrderType.MARKET)
     await broker.place_order(buy)
@@ -74,7 +75,6 @@ async def test_sell_all_removes_position(broker: PaperBroker):
     assert len(positions) == 0
 
 
-@pytest.mark.asyncio
 async def test_insufficient_funds(broker: PaperBroker):
     # Try to buy more than we can afford
     order = OrderRequest(symbol="AAPL", qty=100000, side=Side.BUY, order_type=OrderType.MARKET)
@@ -83,7 +83,6 @@ async def test_insufficient_funds(broker: PaperBroker):
     assert "Insufficient funds" in result.message
 
 
-@pytest.mark.asyncio
 async def test_insufficient_shares(broker: PaperBroker):
     order = OrderRequest(symbol="AAPL", qty=10, side=Side.SELL, order_type=OrderType.MARKET)
     result = await broker.place_order(order)
@@ -91,7 +90,6 @@ async def test_insufficient_shares(broker: PaperBroker):
     assert "Insufficient shares" in result.message
 
 
-@pytest.mark.asyncio
 async def test_limit_order_pending(broker: PaperBroker):
     # Get current price
     quote = await broker.get_quote("AAPL")
@@ -107,7 +105,6 @@ async def test_limit_order_pending(broker: PaperBroker):
     assert result.status == "pending"
 
 
-@pytest.mark.asyncio
 async def test_cancel_pending_order(broker: PaperBroker):
     quote = await broker.get_quote("AAPL")
     order = OrderRequest(
@@ -123,15 +120,13 @@ async def test_cancel_pending_order(broker: PaperBroker):
     assert cancel.status == "cancelled"
 
 
-@pytest.mark.asyncio
 async def test_cancel_nonexistent_order(broker: PaperBroker):
     cancel = await broker.cancel_order("fake_order_123")
     assert cancel.status == "rejected"
 
 
-@pytest.mark.asyncio
-async def test_state_persistence(tmp_path: Path):
-    state_path = tmp_path / "state.json"
+async def test_state_persistence(fast_tmp: Path):
+    state_path = fast_tmp / "state.json"
 
     # First broker instance — buy shares
     b1 = PaperBroker(state_path=state_path)
@@ -144,3 +139,23 @@ async def test_state_persistence(tmp_path: Path):
     assert len(positions) == 1
     assert positions[0].symbol == "AAPL"
     assert positions[0].qty == 10
+
+
+async def test_seeded_prices_are_reproducible(tmp_path: Path):
+    a = PaperBroker(state_path=tmp_path / "a.json", seed=42)
+    b = PaperBroker(state_path=tmp_path / "b.json", seed=42)
+    for symbol in ("AAPL", "MSFT", "AAPL"):
+        assert (await a.get_quote(symbol)).price == (await b.get_quote(symbol)).price
+
+
+async def test_price_snapshot_fills_at_quoted_price(broker: PaperBroker):
+    with broker.price_snapshot():
+        quote = await broker.get_quote("AAPL")
+        assert (await broker.get_quote("AAPL")).price == quote.price
+        order = OrderRequest(symbol="AAPL", qty=1, side=Side.BUY, order_type=OrderType.MARKET)
+        result = await broker.place_order(order)
+        assert result.filled_price == quote.price
+
+    # Outside the block prices keep moving
+    prices = {(await broker.get_quote("AAPL")).price for _ in range(10)}
+    assert len(prices) > 1
@@ -1,115 +1,110 @@
 """Integration tests for MCP tools — full order flow with mandate enforcement."""
 
+import asyncio
 from pathlib import Path
 
 import pytest
 import yaml
 
 from vestbridge import config as vest_config
+from vestbridge import server
 from vestbridge.server import get_account, get_audit_log, get_quote, place_order
 
 
 @pytest.fixture(autouse=True)
-def isolated_vest_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+def isolated_vest_dir(fast_tmp: Path, monkeypatch: pytest.MonkeyPatch):
     """Redirect ~/.vest/ to a temp dir for test isolation."""
-    vest_dir = tmp_path / ".vest"
+    vest_dir = fast_tmp / ".vest"
     vest_dir.mkdir()
-    (vest_dir / "mandates").mkdir()
-    (vest_dir / "agents").mkdir()
-    (vest_dir / "paper").mkdir()
+    for sub in ("mandates", "agents", "paper"):
+        (vest_dir / sub).mkdir()
 
-    monkeypatch.setattr(vest_config, "VEST_DIR", vest_dir)
-    monkeypatch.setattr(vest_config, "MANDATES_DIR", vest_dir / "mandates")
-    monkeypatch.setattr(vest_config, "AGENTS_DIR", vest_dir / "agents")
-    monkeypatch.setattr(vest_config, "PAPER_DIR", vest_dir / "paper")
+    monkeypatch.setenv("VESTBRIDGE_HOME", str(vest_dir))
+    vest_config.get_paths.cache_clear()
 
-    # Also patch the server module's imports
-    from vestbridge import server
-    from vestbridge.brokers import paper as paper_mod
+    server._reset_context_cache()
+    server._reset_broker_cache()
+    yield vest_dir
+    server._reset_context_cache()
+    server._reset_broker_cache()
+    vest_config.get_paths.cache_clear()
 
-    monkeypatch.setattr(server, "MANDATES_DIR", vest_dir / "mandates")
-    monkeypatch.setattr(paper_mod, "STATE_FILE", vest_dir / "paper" / "state.json")
 
-    yield vest_dir
+def _mandate(**permissions) -> bytes:
+    return yaml.safe_dump({"permissions": permissions}).encode()
+
 
+# Serialized once at import; tests only write the bytes out
+_MANDATE_WITHIN_LIMITS = _mandate(
+    max_order_size_usd=100000,
+    allowed_symbols=["AAPL", "MSFT"],
+    allowed_sides=["buy", "sell"],
+    allowed_order_types=["market", "limit"],
+    allowed_asset_types=["equity"],
+)
+_MANDATE_BLOCK_GME_AMC = _mandate(blocked_symbols=["GME", "AMC"])
+_MANDATE_BLOCK_GME = _mandate(blocked_symbols=["GME"])
+_MANDATE_MAX_100_USD = _mandate(max_order_size_usd=100)
+_MANDATE_ONE_TRADE = _mandate(max_daily_trades=1)
 
-def write_mandate(vest_dir: Path, mandate: dict) -> None:
-    with open(vest_dir / "mandates" / "default.yaml", "w") as f:
-        yaml.dump(mandate, f)
+
+def write_mandate(vest_dir: Path, payload: bytes) -> None:
+    (vest_dir / "mandates" / "default.yaml").write_bytes(payload)
 
 
-@pytest.mark.asyncio
 async def test_get_quote_returns_data(isolated_vest_dir: Path):
     result = await get_quote("AAPL")
     assert result["symbol"] == "AAPL"
     assert result["price"] > 0
 
 
-@pytest.mark.asyncio
 async def test_get_account_returns_data(isolated_vest_dir: Path):
     result = await get_account()
     assert result["cash_balance"] == 100_000.0
 
 
-@pytest.mark.asyncio
 async def test_place_order_no_mandate(isolated_vest_dir: Path):
     """Without a mandate file, orders should execute freely."""
     result = await place_order(symbol="AAPL", qty=10, side="buy")
     assert result["status"] == "filled"
 
 
-@pytest.mark.asyncio
-async def test_place_order_mandate_pass(isolated_vest_dir: Path):
-    """Order within mandate limits should pass."""
-    write_mandate(
-        isolated_vest_dir,
-        {
-            "permissions": {
-                "max_order_size_usd": 100000,
-                "allowed_symbols": ["AAPL", "MSFT"],
-                "allowed_sides": ["buy", "sell"],
-                "allowed_order_types": ["market", "limit"],
-                "allowed_asset_types": ["equity"],
-            }
-        },
-    )
-    result = await place_order(symbol="AAPL", qty=10, side="buy")
-    assert result["status"] == "filled"
-
-
-@pytest.mark.asyncio
-async def test_place_order_mandate_blocks_symbol(isolated_vest_dir: Path):
-    """Order for blocked symbol should be rejected."""
-    write_mandate(
-        isolated_vest_dir,
-        {
-            "permissions": {
-                "blocked_symbols": ["GME", "AMC"],
-            }
-        },
-    )
-    result = await place_order(symbol="GME", qty=10, side="buy")
-    assert result["status"] == "blocked"
-    assert "blocked" in result["reason"].lower()
-
-
-@pytest.mark.asyncio
-async def test_place_order_mandate_blocks_size(isolated_vest_dir: Path):
-    """Order exceeding max size should be rejected."""
-    write_mandate(
-        isolated_vest_dir,
+@pytest.mark.parametrize(
+    ("mandate", "symbol", "qty", "status", "reason"),
+    [
+        # Order within mandate limits should pass
+        pytest.param(_MANDATE_WITHIN_LIMITS, "AAPL", 10, "filled", None, id="pass"),
+        # Order for blocked symbol should be rejected
+        pytest.param(_MANDATE_BLOCK_GME_AMC, "GME", 10, "blocked", "blocked", id="blocks_symbol"),
+        # Order exceeding max size should be rejected
+        pytest.param(_MANDATE_MAX_100_USD, "AAPL", 1000, "blocked", "exceeds", id="blocks_size"),
+    ],
+)
+async def test_place_order_mandate(
+    isolated_vest_dir: Path, mandate: bytes, symbol: str, qty: int, status: str, reason: str | None
+):
+    write_mandate(isolated_vest_dir, mandate)
+    result = await place_order(symbol=symbol, qty=qty, side="buy")
+    assert result["status"] == status
+    if reason is not None:
+        assert reason in result["reason"].lower()
+
+
+async def test_blocked_order_check_details_are_opt_in(isolated_vest_dir: Path):
+    write_mandate(isolated_vest_dir, _MANDATE_BLOCK_GME)
+    result = await place_order(symbol="GME", qty=1, side="buy")
+    assert "checks" not in result
+
+    result = await place_order(symbol="GME", qty=1, side="buy", verbose=True)
+    assert result["checks"] == [
         {
-            "permissions": {
-                "max_order_size_usd": 100,
-            }
-        },
-    )
-    result = await place_order(symbol="AAPL", qty=1000, side="buy")
-    assert result["status"] == "blocked"
-    assert "exceeds" in result["reason"].lower()
+            "check_name": "symbol_blocklist",
+            "passed": False,
+            "reason": "GME is in blocked symbols list",
+        }
+    ]
 
 
-@pytest.mark.asyncio
 async def test_audit_log_records_actions(isolated_vest_dir: Path):
     """Actions should appear in the audit log."""
     await get_quote("AAPL")
@@ -121,20 +116,34 @@ async def test_audit_log_records_actions(isolated_vest_dir: Path):
     assert "get_quote" in actions
 
 
-@pytest.mark.asyncio
 async def test_blocked_order_appears_in_audit(isolated_vest_dir: Path):
     """Blocked orders should be logged to audit trail."""
-    write_mandate(
-        isolated_vest_dir,
-        {
-            "permissions": {
-                "blocked_symbols": ["GME"],
-            }
-        },
-    )
+    write_mandate(isolated_vest_dir, _MANDATE_BLOCK_GME)
     await place_order(symbol="GME", qty=10, side="buy")
 
     log = await get_audit_log(n=10)
     order_entries = [e for e in log if e["action"] == "place_order"]
     assert len(order_entries) >= 1
     assert order_entries[-1]["mandate_check"] == "FAIL"
+
+
+async def test_concurrent_orders_share_daily_trade_limit(isolated_vest_dir: Path):
+    """Concurrent orders must not both pass on the same remaining trade slot."""
+    write_mandate(isolated_vest_dir, _MANDATE_ONE_TRADE)
+
+    results = await asyncio.gather(
+        place_order(symbol="AAPL", qty=1, side="buy"),
+        place_order(symbol="MSFT", qty=1, side="buy"),
+    )
+    assert sorted(r["status"] for r in results) == ["blocked", "filled"]
+
+
+async def test_mandate_is_parsed_once_until_it_changes(isolated_vest_dir: Path):
+    write_mandate(isolated_vest_dir, _MANDATE_WITHIN_LIMITS)
+    engine, _ = server._get_mandate_engine()
+    assert server._get_mandate_engine()[0] is engine
+    assert (await place_order(symbol="GME", qty=1, side="buy"))["status"] == "blocked"
+
+    write_mandate(isolated_vest_dir, _MANDATE_BLOCK_GME_AMC)
+    assert server._get_mandate_engine()[0] is not engine
+    assert (await place_order(symbol="AAPL", qty=1, side="buy"))["status"] == "filled"